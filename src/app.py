@@ -12,10 +12,10 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import tkinter.font as tkfont
 
-from constants import C, VERSION, SEARCH_MODES, _EXT_MAP
+from constants import C, VERSION, SEARCH_MODES, _EXT_MAP, _HEXDUMP_ASCII_TBL
 from utils import (_q, _le, fmtb, vb, _snippet, fmt_count, _int_count,
-                   blob_type, try_decode_timestamp, _build_schema_text,
-                   _build_schema_html)
+                   blob_type, _cached_try_decode_timestamp, _build_schema_text,
+                   _iter_schema_html)
 from database import DB
 from widgets import ToolTip, TreeviewTooltip, setup_theme
 from dialogs import HelpDialog, ScopeDlg, BlobViewer, RowWin
@@ -158,7 +158,7 @@ class App(tk.Tk):
         ttk.Button(inner, text="Close DB", style="HB.TButton",
                    command=self._close_db).pack(side="right", padx=3)
         ttk.Button(inner, text="Help", style="HB.TButton",
-                   command=lambda: HelpDialog(self)).pack(side="right", padx=3)
+                   command=lambda: HelpDialog.show(self)).pack(side="right", padx=3)
         ttk.Button(inner, text="Info", style="HB.TButton",
                    command=self._show_info).pack(side="right", padx=3)
         ttk.Button(inner, text="Open", style="HB.TButton",
@@ -481,14 +481,25 @@ class App(tk.Tk):
             filetypes=[("HTML", "*.html"), ("All", "*.*")])
         if not path:
             return
+        tmp = None
         try:
-            html = _build_schema_html(self.db, self.db._path or "", VERSION,
-                                      tables=tables, row_counts=self._count_cache)
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(html)
+            # Stream chunks to a temp file next to the target instead of
+            # building one big string; it only replaces the target once the
+            # whole report has been written, so a failure leaves no partial file
+            tmp = path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.writelines(_iter_schema_html(self.db, self.db._path or "", VERSION,
+                                               tables=tables, row_counts=self._count_cache))
+            os.replace(tmp, path)
+            tmp = None
             messagebox.showinfo("Exported", f"Schema report exported:\n{os.path.basename(path)}\n"
                                 f"{len(tables)} tables documented.")
         except Exception as e:
+            if tmp:
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
             messagebox.showerror("Error", str(e))
 
     def _schema_ctx_search(self, tbl):
@@ -2167,7 +2178,7 @@ class App(tk.Tk):
                          wraplength=500, justify="left", anchor="nw").pack(side="left", padx=4)
                 # Timestamp
                 if isinstance(v, (int, float)):
-                    ts = try_decode_timestamp(v)
+                    ts = _cached_try_decode_timestamp(v)
                     if ts:
                         for fmt_name, decoded in ts:
                             tk.Label(row_f, text=f"{fmt_name}: {decoded}",
@@ -3712,8 +3723,8 @@ class App(tk.Tk):
         show_bytes = min(len(page_data), 4096)
         for off in range(0, show_bytes, 16):
             chunk = page_data[off:off + 16]
-            hex_part = " ".join(f"{b:02X}" for b in chunk)
-            ascii_part = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
+            hex_part = chunk.hex(" ").upper()
+            ascii_part = bytes(chunk).translate(_HEXDUMP_ASCII_TBL).decode("latin-1")
             hex_lines.append(f"{off:08X}  {hex_part:<48s}  {ascii_part}")
         if len(page_data) > 4096:
             hex_lines.append(f"\n... ({len(page_data) - 4096:,} more bytes not shown)")
@@ -4700,8 +4711,8 @@ class App(tk.Tk):
         ]
         for off in range(0, show_bytes, 16):
             chunk = page_data[off:off + 16]
-            hex_p   = " ".join("{:02X}".format(b) for b in chunk)
-            ascii_p = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
+            hex_p   = chunk.hex(" ").upper()
+            ascii_p = bytes(chunk).translate(_HEXDUMP_ASCII_TBL).decode("latin-1")
             lines.append("{:08X}  {:<48s}  {}".format(off, hex_p, ascii_p))
         if len(page_data) > 4096:
             lines.append("\n... ({:,} more bytes)".format(len(page_data) - 4096))
@@ -84,6 +84,9 @@ _EXT_MAP = {
     "RIFF": ".riff",
 }
 
+# Hex dump ASCII column: printable ASCII maps to itself, everything else to "."
+_HEXDUMP_ASCII_TBL = bytes(b if 32 <= b < 127 else 0x2E for b in range(256))
+
 # ── WAL constants ────────────────────────────────────────────────────────
 WAL_MAGIC_BE = 0x377f0682
 WAL_MAGIC_LE = 0x377f0683
@@ -6,10 +6,29 @@ import re
 import os
 import shutil
 import binascii
+import itertools
 import tempfile
 
 from constants import SEARCH_MODES, PAGE_TYPES
-from utils import _q, _le, _regex_literal_hint, blob_type, fmtb, tr
+from utils import _q, _le, _regex_literal_hint, _hex_match, blob_type, fmtb, tr
+
+# Read-only tuning applied to every connection. journal_mode / synchronous
+# are deliberately absent — changing them would write to the evidence file.
+READ_PRAGMAS = (
+    "PRAGMA cache_size = -65536",      # 64 MiB page cache
+    "PRAGMA mmap_size = 268435456",    # 256 MiB memory-mapped I/O
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA query_only = ON",
+    "PRAGMA wal_autocheckpoint = 0",
+)
+# Extra PRAGMAs for the search connection (long streaming scans)
+SEARCH_PRAGMAS = READ_PRAGMAS + (
+    "PRAGMA read_uncommitted = 1",
+)
+
+
+# sqlite3 only ever returns these exact types, so a type() lookup is safe
+_TYPE_OF = {type(None): "NULL", int: "INTEGER", float: "REAL", bytes: "BLOB"}
 
 
 # ── DB class ─────────────────────────────────────────────────────────────
@@ -60,25 +79,11 @@ class DB:
         uri = "file:" + path.replace("\\", "/") + "?mode=ro"
         self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
         self._conn.row_factory = sqlite3.Row
-        try:
-            self._conn.execute("PRAGMA cache_size = -8000")
-            self._conn.execute("PRAGMA mmap_size = 268435456")
-            self._conn.execute("PRAGMA temp_store = MEMORY")
-            self._conn.execute("PRAGMA query_only = ON")
-            self._conn.execute("PRAGMA wal_autocheckpoint = 0")
-        except Exception:
-            pass
+        DB._apply_pragmas(self._conn, READ_PRAGMAS)
         self._conn.create_function("REGEXP", 2, DB._safe_regexp)
         # Separate search connection — tuple mode, no row_factory overhead
         self._search_conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
-        try:
-            self._search_conn.execute("PRAGMA cache_size = -8000")
-            self._search_conn.execute("PRAGMA mmap_size = 268435456")
-            self._search_conn.execute("PRAGMA temp_store = MEMORY")
-            self._search_conn.execute("PRAGMA query_only = ON")
-            self._search_conn.execute("PRAGMA wal_autocheckpoint = 0")
-        except Exception:
-            pass
+        DB._apply_pragmas(self._search_conn, SEARCH_PRAGMAS)
         self._search_conn.create_function("REGEXP", 2, DB._safe_regexp)
         # Open WAL parser on the BACKUP copy (preserved from checkpoint)
         from wal_parser import WALParser
@@ -91,6 +96,15 @@ class DB:
         if self._wal.valid:
             self._build_wal_page_map()
 
+    @staticmethod
+    def _apply_pragmas(conn, pragmas):
+        """Apply PRAGMAs best-effort — one failing must not skip the rest."""
+        for prag in pragmas:
+            try:
+                conn.execute(prag)
+            except Exception:
+                pass
+
     @staticmethod
     def _safe_regexp(pattern, value):
         if value is None:
@@ -231,6 +245,7 @@ class DB:
         self._wal.page_map = page_map
         self._wal.col_map = col_map
         self._wal.pk_col_idx = pk_col_idx
+        self._wal.rebuild_lookup()
 
     def _map_wal_interior_children(self, page_map):
         """Scan WAL frames for interior pages and map their child pointers.
@@ -773,8 +788,57 @@ class DB:
         sql = self.create_sql(tbl)
         if not sql:
             return []
-        import re
-        return re.findall(r'CHECK\s*\(([^)]+)\)', sql, re.IGNORECASE)
+        return DB._parse_check_constraints(sql)
+
+    @staticmethod
+    def _parse_check_constraints(sql):
+        """Return the body of every CHECK(...) clause in ``sql``.
+
+        Single forward scan: tracks parenthesis depth so nested expressions
+        such as ``CHECK((a > 0) AND (b < 10))`` are returned whole, and
+        skips quoted strings/identifiers so parens or the word CHECK inside
+        them are ignored.
+        """
+        closers = {"'": "'", '"': '"', "`": "`", "[": "]"}
+        upper = sql.upper()
+        n = len(sql)
+        result = []
+        i = 0
+        while i < n:
+            ch = sql[i]
+            if ch in closers:
+                end = sql.find(closers[ch], i + 1)
+                i = n if end == -1 else end + 1
+                continue
+            if (upper.startswith("CHECK", i)
+                    and (i == 0 or not (sql[i - 1].isalnum() or sql[i - 1] == "_"))):
+                j = i + 5
+                while j < n and sql[j].isspace():
+                    j += 1
+                if j < n and sql[j] == "(":
+                    depth = 0
+                    k = j
+                    while k < n:
+                        c = sql[k]
+                        if c in closers:
+                            end = sql.find(closers[c], k + 1)
+                            k = n if end == -1 else end + 1
+                            continue
+                        if c == "(":
+                            depth += 1
+                        elif c == ")":
+                            depth -= 1
+                            if depth == 0:
+                                break
+                        k += 1
+                    if k < n:
+                        result.append(sql[j + 1:k].strip())
+                    i = k + 1
+                    continue
+                i += 5
+                continue
+            i += 1
+        return result
 
     def view_sql(self, name):
         """Get the SQL definition of a view."""
@@ -863,16 +927,26 @@ class DB:
         """Generator yielding search results using separate search connection."""
         if not self.ok or not term:
             return
+        hits = self._search_raw(tbl, cols, term, mode, limit, deep_blob, cancel)
+        try:
+            # islice owns the result limit — _search_raw never counts hits
+            yield from itertools.islice(hits, limit)
+        finally:
+            hits.close()
+
+    def _search_raw(self, tbl, cols, term, mode, limit, deep_blob, cancel):
+        """Yield every hit for ``search()``; ``limit`` only bounds SQL scans."""
         sconn = self._search_conn or self._conn
         mode_key = SEARCH_MODES.get(mode, "ci")
         col_names = [c[0] for c in cols]
         col_types = [c[1].upper() if c[1] else "" for c in cols]
         # Column Name mode
         if mode_key == "col":
+            tl = term.lower()
             for cn in col_names:
                 if cancel and cancel():
                     return
-                if term.lower() in cn.lower():
+                if tl in cn.lower():
                     yield dict(table=tbl, column=cn, rowid="-",
                                value=cn, type="column_name")
             return
@@ -882,8 +956,9 @@ class DB:
                 rx = re.compile(term)
             except re.error:
                 return
-            found = 0
             hint = _regex_literal_hint(term)
+            # ASCII-lowered bytes form of the hint, matching LIKE's case folding
+            hint_b = hint.lower().encode("ascii") if hint and hint.isascii() else None
             qtbl = _q(tbl)
             # Build SQL: use LIKE pre-filter if we have a literal hint
             if hint:
@@ -898,18 +973,24 @@ class DB:
                     params.append(f"%{esc_hint}%")
                     rx_indices.append(ci)
                 if parts:
-                    sql = f"SELECT rowid, * FROM {qtbl} WHERE {' OR '.join(parts)}"
+                    where = f" WHERE {' OR '.join(parts)}"
                 else:
-                    sql = f"SELECT rowid, * FROM {qtbl}"
+                    where = ""
                     params = []
                     rx_indices = list(range(len(col_names)))
             else:
-                sql = f"SELECT rowid, * FROM {qtbl}"
+                where = ""
                 params = []
                 rx_indices = [ci for ci in range(len(col_names))
                               if deep_blob or "BLOB" not in col_types[ci]]
+            if not rx_indices:
+                return
+            # Fetch only the columns the regex will look at — skipped BLOB
+            # columns never cross the sqlite3 → Python boundary.
+            proj = ", ".join(_q(col_names[ci]) for ci in rx_indices)
             try:
-                cur = sconn.execute(sql, params)
+                cur = sconn.execute(f"SELECT rowid, {proj} FROM {qtbl}{where}",
+                                    params)
             except Exception:
                 return
             while True:
@@ -922,39 +1003,38 @@ class DB:
                     if cancel and cancel():
                         return
                     rid = row[0]
-                    for i in rx_indices:
-                        v = row[i + 1]
+                    for j, i in enumerate(rx_indices, 1):
+                        v = row[j]
                         if v is None:
                             continue
                         if isinstance(v, bytes):
                             if not deep_blob:
                                 continue
-                            try:
-                                s = v.decode("utf-8", "replace")
-                            except Exception:
-                                continue
-                        else:
-                            s = str(v)
+                            # Cheap byte-level checks on the literal hint decide
+                            # whether the decode and hexlify scans can match at all
+                            if hint_b is None or hint_b in v.lower():
+                                try:
+                                    s = v.decode("utf-8", "replace")
+                                except Exception:
+                                    s = None
+                                if s is not None and rx.search(s):
+                                    yield dict(table=tbl, column=col_names[i], rowid=rid,
+                                               value=tr(s), type=DB._dt(v))
+                            if not hint or _hex_match(v, hint):
+                                hx = binascii.hexlify(v).decode()
+                                if rx.search(hx):
+                                    yield dict(table=tbl, column=col_names[i], rowid=rid,
+                                               value=f"[hex match in {fmtb(len(v))}]",
+                                               type="blob_hex")
+                            continue
+                        s = str(v)
                         if rx.search(s):
-                            found += 1
                             yield dict(table=tbl, column=col_names[i], rowid=rid,
                                        value=tr(s), type=DB._dt(v))
-                            if found >= limit:
-                                return
-                        if deep_blob and isinstance(v, bytes):
-                            hx = binascii.hexlify(v).decode()
-                            if rx.search(hx):
-                                found += 1
-                                yield dict(table=tbl, column=col_names[i], rowid=rid,
-                                           value=f"[hex match in {fmtb(len(v))}]",
-                                           type="blob_hex")
-                                if found >= limit:
-                                    return
             return
         # Combined OR query — single table scan
         # Skip BLOB-typed columns in SQL WHERE (unless blob mode) to avoid
         # scanning huge binary data; Python-side already skips bytes.
-        found = 0
         esc = _le(term)
         qtbl = _q(tbl)
         parts = []
@@ -986,133 +1066,74 @@ class DB:
             search_col_indices.append(ci)
         if not parts:
             return
+        # Each WHERE term is also projected as a 0/1 flag so SQLite reports
+        # which columns hit — no Python-side re-matching of every value.
+        # Only the searched columns are fetched, never the whole row.
+        n_flags = len(parts)
+        proj = ", ".join(_q(col_names[ci]) for ci in search_col_indices)
         try:
-            sql = f"SELECT rowid, * FROM {qtbl} WHERE {' OR '.join(parts)} LIMIT {limit}"
-            cur = sconn.execute(sql, params)
+            sql = (f"SELECT rowid, {', '.join(parts)}, {proj} FROM {qtbl} "
+                   f"WHERE {' OR '.join(parts)} LIMIT {limit}")
+            cur = sconn.execute(sql, params + params)
         except Exception:
             return
-        # Inline column matching — only check columns included in WHERE
-        check_indices = search_col_indices if mode_key != "blob" else list(range(len(col_names)))
-        if mode_key == "ci" or mode_key not in ("cs", "ex", "sw", "ew", "blob"):
-            tl = term.lower()
-            for row in cur:
-                if cancel and cancel():
-                    return
-                rid = row[0]
-                for i in check_indices:
-                    v = row[i + 1]
-                    if v is not None and not isinstance(v, bytes) and tl in str(v).lower():
-                        found += 1
-                        yield dict(table=tbl, column=col_names[i], rowid=rid,
-                                   value=tr(str(v)), type=DB._dt(v))
-                        if found >= limit:
-                            return
-        elif mode_key == "cs":
-            for row in cur:
-                if cancel and cancel():
-                    return
-                rid = row[0]
-                for i in check_indices:
-                    v = row[i + 1]
-                    if v is not None and not isinstance(v, bytes) and term in str(v):
-                        found += 1
-                        yield dict(table=tbl, column=col_names[i], rowid=rid,
-                                   value=tr(str(v)), type=DB._dt(v))
-                        if found >= limit:
-                            return
-        elif mode_key == "ex":
-            for row in cur:
-                if cancel and cancel():
-                    return
-                rid = row[0]
-                for i in check_indices:
-                    v = row[i + 1]
-                    if v is not None and not isinstance(v, bytes) and str(v) == term:
-                        found += 1
-                        yield dict(table=tbl, column=col_names[i], rowid=rid,
-                                   value=tr(str(v)), type=DB._dt(v))
-                        if found >= limit:
-                            return
-        elif mode_key == "sw":
-            tl = term.lower()
-            for row in cur:
-                if cancel and cancel():
-                    return
-                rid = row[0]
-                for i in check_indices:
-                    v = row[i + 1]
-                    if v is not None and not isinstance(v, bytes) and str(v).lower().startswith(tl):
-                        found += 1
-                        yield dict(table=tbl, column=col_names[i], rowid=rid,
-                                   value=tr(str(v)), type=DB._dt(v))
-                        if found >= limit:
-                            return
-        elif mode_key == "ew":
-            tl = term.lower()
-            for row in cur:
-                if cancel and cancel():
-                    return
-                rid = row[0]
-                for i in check_indices:
-                    v = row[i + 1]
-                    if v is not None and not isinstance(v, bytes) and str(v).lower().endswith(tl):
-                        found += 1
-                        yield dict(table=tbl, column=col_names[i], rowid=rid,
-                                   value=tr(str(v)), type=DB._dt(v))
-                        if found >= limit:
-                            return
-        elif mode_key == "blob":
-            tl = term.lower()
-            for row in cur:
-                if cancel and cancel():
-                    return
-                rid = row[0]
-                for i in check_indices:
-                    v = row[i + 1]
-                    if v is None:
+        val_base = n_flags + 1  # row layout: rowid, flags..., searched columns
+        is_blob = mode_key == "blob"
+        tl = term.lower()
+        for row in cur:
+            if cancel and cancel():
+                return
+            rid = row[0]
+            for j, i in enumerate(search_col_indices):
+                v = row[val_base + j]
+                if v is None:
+                    continue
+                if isinstance(v, bytes):
+                    if not is_blob:
                         continue
-                    if isinstance(v, bytes):
-                        try:
-                            sv = v.decode("utf-8", "replace")
-                        except Exception:
-                            continue
-                        if tl in sv.lower():
-                            found += 1
-                            yield dict(table=tbl, column=col_names[i], rowid=rid,
-                                       value=tr(sv), type=DB._dt(v))
-                            if found >= limit:
-                                return
-                    elif tl in str(v).lower():
-                        found += 1
-                        yield dict(table=tbl, column=col_names[i], rowid=rid,
-                                   value=tr(str(v)), type=DB._dt(v))
-                        if found >= limit:
-                            return
+                    # CAST(blob AS TEXT) stops at the first NUL byte, so the
+                    # SQL flag can miss — re-check the decoded bytes here.
+                    s = v.decode("utf-8", "replace")
+                    if tl not in s.lower():
+                        continue
+                elif not row[j + 1]:
+                    continue
+                else:
+                    s = str(v)
+                yield dict(table=tbl, column=col_names[i], rowid=rid,
+                           value=tr(s), type=DB._dt(v))
         # Deep blob hex search
         if deep_blob and mode_key == "blob":
-            for cn in col_names:
-                if cancel and cancel():
-                    return
-                if found >= limit:
-                    return
-                qcol = _q(cn)
-                try:
-                    sql2 = f"SELECT rowid, {qcol} FROM {_q(tbl)} WHERE typeof({qcol})='blob' LIMIT {limit - found}"
-                    for br in sconn.execute(sql2):
-                        if cancel and cancel():
-                            return
-                        bv = br[1]
-                        if isinstance(bv, bytes):
-                            hx = binascii.hexlify(bv).decode()
-                            if term.lower() in hx.lower():
-                                found += 1
-                                yield dict(table=tbl, column=cn, rowid=br[0],
-                                           value=f"[hex match in {fmtb(len(bv))}]",
-                                           type="blob_hex")
-                                if found >= limit:
-                                    return
-                except Exception:
-                    pass
+            for cn, rid, size in self._deep_blob_hex(tbl, col_names, term,
+                                                     limit, cancel):
+                yield dict(table=tbl, column=cn, rowid=rid,
+                           value=f"[hex match in {fmtb(size)}]",
+                           type="blob_hex")
+
+    def _deep_blob_hex(self, tbl, col_names, term, limit, cancel):
+        """Yield (column, rowid, blob_size) for BLOBs whose hex contains term.
+
+        Columns are scanned one after another, in column order, on the
+        search connection, so a given limit always returns the same rows.
+        """
+        sconn = self._search_conn or self._conn
+        if sconn is None:
+            return
+        qtbl = _q(tbl)
+        for cn in col_names:
+            if cancel and cancel():
+                return
+            qcol = _q(cn)
+            try:
+                sql = (f"SELECT rowid, {qcol} FROM {qtbl} "
+                       f"WHERE typeof({qcol})='blob' LIMIT {limit}")
+                for rid, bv in sconn.execute(sql):
+                    if cancel and cancel():
+                        return
+                    if isinstance(bv, bytes) and _hex_match(bv, term):
+                        yield cn, rid, len(bv)
+            except Exception:
+                pass
 
     def browse(self, tbl, lim, off, ocol=None, odir="ASC"):
         if not self.ok:
@@ -1361,15 +1382,7 @@ class DB:
     @staticmethod
     def _dt(v):
         """Detect type."""
-        if v is None:
-            return "NULL"
-        if isinstance(v, int):
-            return "INTEGER"
-        if isinstance(v, float):
-            return "REAL"
-        if isinstance(v, bytes):
-            return "BLOB"
-        return "TEXT"
+        return _TYPE_OF.get(type(v), "TEXT")
 
     @staticmethod
     def _match(v, t, m, db=None):
@@ -2,50 +2,63 @@
 
 import sys
 import os
+import re
 import io
-import csv
 import json
-import binascii
+import base64
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
-from constants import C, HAS_PIL, VERSION, _EXT_MAP
+from constants import C, HAS_PIL, VERSION, _EXT_MAP, _HEXDUMP_ASCII_TBL
 if HAS_PIL:
     from constants import PILImage, ImageTk
-from utils import blob_type, is_image, fmtb, try_decode_timestamp, _build_schema_text, fmt_count, _int_count
+from utils import blob_type, is_image, fmtb, _cached_try_decode_timestamp, _build_schema_text, fmt_count, _int_count
+
+# Help > ABOUT text; nothing in it changes while the process runs
+_PY_VER = sys.version.split()[0]
+_ABOUT_TEXT = (f"SQLite GUI Analyzer v{VERSION}\n"
+               f"Python {_PY_VER}\n"
+               f"Pillow: {'Installed' if HAS_PIL else 'Not installed (optional, for JPEG/WEBP images)'}")
 
 
 # ── HelpDialog ───────────────────────────────────────────────────────────
 class HelpDialog(tk.Toplevel):
-    def __init__(self, parent):
-        super().__init__(parent)
-        self.title("SQLite GUI Analyzer - Help")
-        self.geometry("750x600")
-        self.configure(bg=C["bg"])
-        self.transient(parent)
-
-        txt = tk.Text(self, wrap="word", font=("Segoe UI", 10), bg=C["bg"],
-                      fg=C["text"], relief="flat", padx=16, pady=12)
-        sb = ttk.Scrollbar(self, orient="vertical", command=txt.yview)
-        txt.configure(yscrollcommand=sb.set)
-        sb.pack(side="right", fill="y")
-        txt.pack(fill="both", expand=True)
+    # Help content as (text, tag) segments, built on first open and shared
+    # by every later instance; replayed with a single multi-argument insert
+    _segments = None
+    _plain = None
+    _instance = None
 
-        txt.tag_configure("h1", font=("Segoe UI", 14, "bold"), foreground=C["accent"],
-                          spacing1=12, spacing3=6)
-        txt.tag_configure("h2", font=("Segoe UI", 11, "bold"), foreground=C["text"],
-                          spacing1=10, spacing3=4)
-        txt.tag_configure("code", font=("Consolas", 10), foreground=C["purple"],
-                          background=C["bg2"])
-        txt.tag_configure("tip", foreground=C["green"], font=("Segoe UI", 10, "italic"))
-        txt.tag_configure("warn", foreground=C["red"], font=("Segoe UI", 10, "bold"))
+    @classmethod
+    def show(cls, parent):
+        """Reuse the hidden Help window if it is still alive."""
+        w = cls._instance
+        if w is not None:
+            try:
+                if w.winfo_exists():
+                    w.deiconify()
+                    w.lift()
+                    w.focus_set()
+                    return w
+            except Exception:
+                pass
+        w = cls._instance = cls(parent)
+        return w
 
-        def h1(t): txt.insert("end", t + "\n", "h1")
-        def h2(t): txt.insert("end", t + "\n", "h2")
-        def p(t): txt.insert("end", t + "\n\n")
-        def code(t): txt.insert("end", t + "\n", "code"); txt.insert("end", "\n")
-        def tip(t): txt.insert("end", t + "\n\n", "tip")
-        def warn(t): txt.insert("end", t + "\n\n", "warn")
+    @classmethod
+    def _help_segments(cls):
+        if cls._segments is not None:
+            return cls._segments
+        segs = []
+        def h1(t): segs.append((t + "\n", "h1"))
+        def h2(t): segs.append((t + "\n", "h2"))
+        def p(t): segs.append((t + "\n\n", ""))
+        def code(t): segs.append((t + "\n", "code")); segs.append(("\n", ""))
+        def tip(t): segs.append((t + "\n\n", "tip"))
+        def warn(t): segs.append((t + "\n\n", "warn"))
 
         h1("SQLite GUI Analyzer v" + VERSION)
 
@@ -163,9 +176,39 @@ class HelpDialog(tk.Toplevel):
           "- Enable 'Search WAL' to find data in uncommitted transactions and old WAL frames.")
 
         h2("ABOUT")
-        p(f"SQLite GUI Analyzer v{VERSION}\n"
-          f"Python {sys.version.split()[0]}\n"
-          f"Pillow: {'Installed' if HAS_PIL else 'Not installed (optional, for JPEG/WEBP images)'}")
+        p(_ABOUT_TEXT)
+
+        cls._segments = segs
+        cls._plain = "".join(t for t, _ in segs)
+        return segs
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.title("SQLite GUI Analyzer - Help")
+        self.geometry("750x600")
+        self.configure(bg=C["bg"])
+        self.transient(parent)
+
+        txt = tk.Text(self, wrap="word", font=("Segoe UI", 10), bg=C["bg"],
+                      fg=C["text"], relief="flat", padx=16, pady=12)
+        sb = ttk.Scrollbar(self, orient="vertical", command=txt.yview)
+        txt.configure(yscrollcommand=sb.set)
+        sb.pack(side="right", fill="y")
+        txt.pack(fill="both", expand=True)
+
+        txt.tag_configure("h1", font=("Segoe UI", 14, "bold"), foreground=C["accent"],
+                          spacing1=12, spacing3=6)
+        txt.tag_configure("h2", font=("Segoe UI", 11, "bold"), foreground=C["text"],
+                          spacing1=10, spacing3=4)
+        txt.tag_configure("code", font=("Consolas", 10), foreground=C["purple"],
+                          background=C["bg2"])
+        txt.tag_configure("tip", foreground=C["green"], font=("Segoe UI", 10, "italic"))
+        txt.tag_configure("warn", foreground=C["red"], font=("Segoe UI", 10, "bold"))
+
+        flat = []
+        for seg in self._help_segments():
+            flat.extend(seg)
+        txt.insert("end", *flat)
 
         txt.configure(state="disabled")
 
@@ -173,13 +216,13 @@ class HelpDialog(tk.Toplevel):
         btnf.pack(fill="x", padx=8, pady=8)
 
         def copy_help():
-            txt.configure(state="normal")
             self.clipboard_clear()
-            self.clipboard_append(txt.get("1.0", "end"))
-            txt.configure(state="disabled")
+            self.clipboard_append(HelpDialog._plain + "\n")
 
         ttk.Button(btnf, text="Copy", command=copy_help).pack(side="left", padx=4)
-        ttk.Button(btnf, text="Close", command=self.destroy).pack(side="right", padx=4)
+        ttk.Button(btnf, text="Close", command=self.withdraw).pack(side="right", padx=4)
+        # Closing only hides the window; it is torn down with its parent
+        self.protocol("WM_DELETE_WINDOW", self.withdraw)
 
 
 # ── ScopeDlg ─────────────────────────────────────────────────────────────
@@ -195,7 +238,10 @@ class ScopeDlg(tk.Toplevel):
         self._tables = tables
         self._counts = counts
         self._vars = {}
+        self._cbs = {}
+        self._packed = set()
         self._visible_tables = []
+        self._rebuild_after = None
 
         # Filter row
         top = ttk.Frame(self)
@@ -204,7 +250,7 @@ class ScopeDlg(tk.Toplevel):
         self._filter_var = tk.StringVar()
         fe = ttk.Entry(top, textvariable=self._filter_var, width=25)
         fe.pack(side="left", padx=(0, 6))
-        self._filter_var.trace_add("write", lambda *_: self._rebuild_list())
+        self._filter_var.trace_add("write", lambda *_: self._schedule_rebuild())
 
         self._hide_empty = tk.BooleanVar(value=True)
         ttk.Checkbutton(top, text="Hide empty", variable=self._hide_empty,
@@ -245,13 +291,23 @@ class ScopeDlg(tk.Toplevel):
                 self._canvas.yview_scroll(int(-1 * (e.delta / 120)), "units")
             except Exception:
                 pass
-        self._scope_scroll_fn = _scope_scroll
-        self._canvas.bind("<MouseWheel>", _scope_scroll)
-        self._inner.bind("<MouseWheel>", _scope_scroll)
+        # One binding on the toplevel: every child has it in its bindtags
+        self.bind("<MouseWheel>", _scope_scroll)
 
-        # Create vars for ALL tables (persist across rebuilds)
+        # Selection lives in a plain dict; checkbuttons have no Tcl variable
+        # and are created once for ALL tables, filtering only packs/unpacks them
         for t in tables:
-            self._vars[t] = tk.BooleanVar(value=(t in selected))
+            self._vars[t] = t in selected
+            cb = ttk.Checkbutton(self._inner, text=f"{t}  ({fmt_count(self._get_count(t))})",
+                                  variable="", command=lambda t=t: self._on_toggle(t))
+            cb.state(["!alternate", "selected" if self._vars[t] else "!selected"])
+            self._cbs[t] = cb
+
+        # Selection counters, kept up to date incrementally
+        self._total = len(tables)
+        self._sel_count = sum(self._vars.values())
+        self._vis_sel = 0
+        self._last_summary = ""
 
         self._summary = ttk.Label(self, style="M.TLabel")
         self._summary.pack(fill="x", padx=8)
@@ -266,10 +322,14 @@ class ScopeDlg(tk.Toplevel):
     def _get_count(self, t):
         return _int_count(self._counts.get(t, 0))
 
+    def _schedule_rebuild(self):
+        if self._rebuild_after:
+            self.after_cancel(self._rebuild_after)
+        self._rebuild_after = self.after(80, self._rebuild_list)
+
     def _rebuild_list(self):
-        """Destroy and recreate checkbuttons based on filter + hide-empty."""
-        for w in self._inner.winfo_children():
-            w.destroy()
+        """Show/hide the pooled checkbuttons based on filter + hide-empty."""
+        self._rebuild_after = None
         filt = self._filter_var.get().lower().strip()
         he = self._hide_empty.get()
         self._visible_tables = []
@@ -280,50 +340,77 @@ class ScopeDlg(tk.Toplevel):
             if he and cnt == 0:
                 continue
             self._visible_tables.append(t)
+        # Only touch widgets whose visibility changed; newly shown ones are
+        # packed next to their visible neighbour to keep table order
+        vis = set(self._visible_tables)
+        for t in self._packed - vis:
+            self._cbs[t].pack_forget()
+        self._packed &= vis
+        anchor = next((t for t in self._visible_tables if t in self._packed), None)
+        prev = None
         for t in self._visible_tables:
-            cnt = self._get_count(t)
-            cnt_str = fmt_count(cnt)
-            cb = ttk.Checkbutton(self._inner, text=f"{t}  ({cnt_str})",
-                                  variable=self._vars[t], command=self._update_summary)
-            cb.pack(anchor="w", pady=1, padx=4)
-            cb.bind("<MouseWheel>", self._scope_scroll_fn)
+            if t not in self._packed:
+                if prev is not None:
+                    self._cbs[t].pack(anchor="w", pady=1, padx=4, after=self._cbs[prev])
+                elif anchor is not None:
+                    self._cbs[t].pack(anchor="w", pady=1, padx=4, before=self._cbs[anchor])
+                else:
+                    self._cbs[t].pack(anchor="w", pady=1, padx=4)
+                self._packed.add(t)
+            prev = t
+        self._vis_sel = sum(1 for t in self._visible_tables if self._vars[t])
         self._update_summary()
 
-    def _sel_all(self):
+    def _set_visible(self, pred):
+        """Set every visible table to pred(t), keeping the counters in step."""
+        vars_ = self._vars
         for t in self._visible_tables:
-            self._vars[t].set(True)
+            new = bool(pred(t))
+            if vars_[t] != new:
+                vars_[t] = new
+                self._cbs[t].state(["selected" if new else "!selected"])
+                self._sel_count += 1 if new else -1
+        self._vis_sel = sum(1 for t in self._visible_tables if vars_[t])
         self._update_summary()
 
+    def _sel_all(self):
+        self._set_visible(lambda t: True)
+
     def _sel_none(self):
-        for t in self._visible_tables:
-            self._vars[t].set(False)
-        self._update_summary()
+        self._set_visible(lambda t: False)
 
     def _sel_invert(self):
-        for t in self._visible_tables:
-            self._vars[t].set(not self._vars[t].get())
-        self._update_summary()
+        self._set_visible(lambda t: not self._vars[t])
 
     def _sel_nonempty(self):
-        for t in self._visible_tables:
-            self._vars[t].set(self._get_count(t) > 0)
+        self._set_visible(lambda t: self._get_count(t) > 0)
+
+    def _on_toggle(self, t):
+        new = not self._vars[t]
+        self._vars[t] = new
+        d = 1 if new else -1
+        self._sel_count += d
+        self._vis_sel += d
         self._update_summary()
 
+    _SUMMARY_FMT = "{} of {} visible selected  |  {} of {} total selected"
+
     def _update_summary(self):
-        sel = sum(1 for v in self._vars.values() if v.get())
-        total = len(self._vars)
-        vis = len(self._visible_tables)
-        vis_sel = sum(1 for t in self._visible_tables if self._vars[t].get())
-        self._summary.configure(
-            text=f"{vis_sel} of {vis} visible selected  |  {sel} of {total} total selected")
+        text = self._SUMMARY_FMT.format(self._vis_sel, len(self._visible_tables),
+                                        self._sel_count, self._total)
+        if text != self._last_summary:
+            self._summary.configure(text=text)
+            self._last_summary = text
 
     def _apply(self):
-        self.result = [t for t, v in self._vars.items() if v.get()]
+        self.result = [t for t, v in self._vars.items() if v]
         self.destroy()
 
 
 # ── BlobViewer ───────────────────────────────────────────────────────────
 class BlobViewer(tk.Toplevel):
+    _HEX_WHEEL_LINES = 3  # hex dump lines per mouse-wheel notch
+
     def __init__(self, parent, data, col_name="BLOB"):
         super().__init__(parent)
         self.title(f"BLOB Viewer - {col_name} ({fmtb(len(data))})")
@@ -333,6 +420,8 @@ class BlobViewer(tk.Toplevel):
         self._pil_img = None
         self._tk_img = None
         self._zoom = 1.0
+        self._zoom_after = None
+        self._resize_cache = OrderedDict()  # (w, h) -> PhotoImage, small LRU
 
         # Pack buttons FIRST at bottom so they're always visible
         btnf = ttk.Frame(self)
@@ -345,11 +434,12 @@ class BlobViewer(tk.Toplevel):
         hex_frame = ttk.Frame(nb)
         nb.add(hex_frame, text="Hex Dump")
         hex_txt = tk.Text(hex_frame, font=("Consolas", 9), wrap="none", bg=C["bg2"])
-        hex_sb = ttk.Scrollbar(hex_frame, orient="vertical", command=hex_txt.yview)
-        hex_txt.configure(yscrollcommand=hex_sb.set)
+        hex_sb = ttk.Scrollbar(hex_frame, orient="vertical", command=self._on_hex_sb)
         hex_sb.pack(side="right", fill="y")
         hex_txt.pack(fill="both", expand=True)
-        self._fill_hex(hex_txt, data[:16384])
+        self._hex_txt = hex_txt
+        self._hex_sb = hex_sb
+        self._fill_hex()
 
         # Text tab
         txt_frame = ttk.Frame(nb)
@@ -359,12 +449,13 @@ class BlobViewer(tk.Toplevel):
         txt_txt.configure(yscrollcommand=txt_sb.set)
         txt_sb.pack(side="right", fill="y")
         txt_txt.pack(fill="both", expand=True)
-        try:
-            decoded = data[:65536].decode("utf-8", errors="replace")
-        except Exception:
-            decoded = "(cannot decode)"
-        txt_txt.insert("1.0", decoded)
         txt_txt.configure(state="disabled")
+        # Decoded only the first time the tab is shown
+        self._nb = nb
+        self._txt_frame = txt_frame
+        self._txt_txt = txt_txt
+        self._text_tab_loaded = False
+        nb.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # Image tab
         if is_image(data):
@@ -386,27 +477,129 @@ class BlobViewer(tk.Toplevel):
 
         def copy_hex():
             self.clipboard_clear()
-            self.clipboard_append(binascii.hexlify(data).decode())
+            self.clipboard_append(data.hex())
 
         def copy_b64():
-            import base64
             self.clipboard_clear()
-            self.clipboard_append(base64.b64encode(data).decode())
+            self.clipboard_append(base64.b64encode(memoryview(data)).decode("ascii"))
 
         ttk.Button(btnf, text="Save", command=save_blob).pack(side="left", padx=4)
         ttk.Button(btnf, text="Copy Hex", command=copy_hex).pack(side="left", padx=4)
         ttk.Button(btnf, text="Copy Base64", command=copy_b64).pack(side="left", padx=4)
         ttk.Button(btnf, text="Close", command=self.destroy).pack(side="right", padx=4)
 
-    def _fill_hex(self, txt, data):
+    def _on_tab_changed(self, event=None):
+        if self._text_tab_loaded or self._nb.select() != str(self._txt_frame):
+            return
+        self._text_tab_loaded = True
+        data = self._data
+        bt = blob_type(data)
+        # A recognised binary signature plus NUL bytes up front means the
+        # decode would only produce replacement characters
+        if bt not in ("BLOB", "Protobuf?", "XML/Plist") and b"\x00" in data[:1024]:
+            decoded = f"({bt} binary \u2014 {fmtb(len(data))}, no text view)"
+        else:
+            try:
+                decoded = data[:65536].decode("utf-8", errors="replace")
+            except Exception:
+                decoded = "(cannot decode)"
+        txt = self._txt_txt
+        txt.configure(state="normal")
+        txt.insert("1.0", decoded)
+        txt.configure(state="disabled")
+
+    def _fill_hex(self):
+        # Virtualized dump: the Text only ever holds the lines that fit in
+        # its window; the separate scrollbar maps to a line (16-byte) offset
+        # into the blob, so opening cost doesn't grow with blob size.
+        txt = self._hex_txt
+        self._hex_total = (len(self._data) + 15) // 16
+        self._hex_top = 0
+        self._hex_rows = int(txt.cget("height"))
+        self._hex_line_px = 0
+        txt.configure(state="disabled")
+        txt.bind("<Configure>", self._on_hex_configure)
+        txt.bind("<MouseWheel>", self._on_hex_wheel)
+        txt.bind("<Button-4>", self._on_hex_wheel)
+        txt.bind("<Button-5>", self._on_hex_wheel)
+        for key, how in (("<Prior>", "page_up"), ("<Next>", "page_down"),
+                         ("<Up>", "up"), ("<Down>", "down"),
+                         ("<Control-Home>", "home"), ("<Control-End>", "end")):
+            txt.bind(key, lambda e, h=how: self._on_hex_key(h))
+        self._render_hex()
+
+    def _render_hex(self):
+        n = self._hex_total
+        rows = self._hex_rows
+        top = self._hex_top = max(0, min(self._hex_top, n - rows))
+        txt = self._hex_txt
+        txt.configure(state="normal")
+        txt.delete("1.0", "end")
+        txt.insert("1.0", self._format_hex(top, top + rows))
+        txt.configure(state="disabled")
+        if n:
+            self._hex_sb.set(top / n, min(top + rows, n) / n)
+        else:
+            self._hex_sb.set(0.0, 1.0)
+
+    def _hex_scroll_to(self, top):
+        top = max(0, min(top, self._hex_total - self._hex_rows))
+        if top != self._hex_top:
+            self._hex_top = top
+            self._render_hex()
+
+    def _on_hex_sb(self, *args):
+        # Scrollbar protocol: ("moveto", fraction) or ("scroll", n, units|pages)
+        if not args:
+            return
+        if args[0] == "moveto":
+            self._hex_scroll_to(int(float(args[1]) * self._hex_total))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if len(args) > 2 and args[2] == "pages":
+                step *= max(1, self._hex_rows - 1)
+            self._hex_scroll_to(self._hex_top + step)
+
+    def _on_hex_wheel(self, event):
+        if event.num == 4:
+            notches = 1
+        elif event.num == 5:
+            notches = -1
+        else:
+            notches = event.delta // 120 or (1 if event.delta > 0 else -1)
+        self._hex_scroll_to(self._hex_top - notches * self._HEX_WHEEL_LINES)
+        return "break"
+
+    def _on_hex_key(self, how):
+        rows = max(1, self._hex_rows - 1)
+        top = self._hex_top
+        top = {"page_up": top - rows, "page_down": top + rows,
+               "up": top - 1, "down": top + 1,
+               "home": 0, "end": self._hex_total}[how]
+        self._hex_scroll_to(top)
+        return "break"
+
+    def _on_hex_configure(self, event=None):
+        txt = self._hex_txt
+        if not self._hex_line_px:
+            info = txt.dlineinfo("1.0")
+            if not info:
+                return
+            self._hex_line_px = info[3]
+        rows = max(1, txt.winfo_height() // self._hex_line_px)
+        if rows != self._hex_rows:
+            self._hex_rows = rows
+            self._render_hex()
+
+    def _format_hex(self, first_line, end_line):
+        tbl = _HEXDUMP_ASCII_TBL
+        data = self._data
         lines = []
-        for i in range(0, len(data), 16):
+        for i in range(first_line * 16, min(end_line * 16, len(data)), 16):
             chunk = data[i:i + 16]
-            hex_part = " ".join(f"{b:02x}" for b in chunk)
-            ascii_part = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
-            lines.append(f"{i:08x}  {hex_part:<48s}  {ascii_part}")
-        txt.insert("1.0", "\n".join(lines))
-        txt.configure(state="disabled")
+            lines.append(f"{i:08x}  {chunk.hex(' '):<48s}  "
+                         f"{chunk.translate(tbl).decode('latin-1')}")
+        return "\n".join(lines)
 
     def _setup_image_tab(self, frame, data):
         if HAS_PIL:
@@ -425,12 +618,13 @@ class BlobViewer(tk.Toplevel):
                 ttk.Button(ctrl, text="Fit", style="Sm.TButton",
                            command=lambda: self._zoom_fit()).pack(side="left", padx=2)
                 ttk.Button(ctrl, text="100%", style="Sm.TButton",
-                           command=lambda: self._set_zoom(1.0)).pack(side="left", padx=2)
+                           command=lambda: self._request_zoom(1.0)).pack(side="left", padx=2)
                 ttk.Button(ctrl, text="Zoom +", style="Sm.TButton",
-                           command=lambda: self._set_zoom(self._zoom * 1.25)).pack(side="left", padx=2)
+                           command=lambda: self._request_zoom(self._zoom * 1.25)).pack(side="left", padx=2)
                 ttk.Button(ctrl, text="Zoom -", style="Sm.TButton",
-                           command=lambda: self._set_zoom(self._zoom / 1.25)).pack(side="left", padx=2)
+                           command=lambda: self._request_zoom(self._zoom / 1.25)).pack(side="left", padx=2)
                 self._zoom_lbl = ttk.Label(ctrl, text="100%", style="M.TLabel")
+                self._zoom_lbl_text = "100%"
                 self._zoom_lbl.pack(side="left", padx=8)
 
                 cvs_frame = ttk.Frame(frame)
@@ -443,7 +637,7 @@ class BlobViewer(tk.Toplevel):
                 xsb.pack(side="bottom", fill="x")
                 self._img_canvas.pack(fill="both", expand=True)
                 self._img_canvas.bind("<MouseWheel>",
-                    lambda e: self._set_zoom(self._zoom * (1.1 if e.delta > 0 else 0.9)))
+                    lambda e: self._request_zoom(self._zoom * (1.1 if e.delta > 0 else 0.9)))
 
                 self.after(100, self._zoom_fit)
             except Exception as e:
@@ -470,26 +664,77 @@ class BlobViewer(tk.Toplevel):
         ch = max(self._img_canvas.winfo_height(), 100)
         iw, ih = self._pil_img.size
         z = min(cw / iw, ch / ih, 1.0)
-        self._set_zoom(z)
+        self._request_zoom(z)
 
-    def _set_zoom(self, z):
+    def _request_zoom(self, z):
+        """Update the zoom level now, but coalesce the resize into one render."""
         if not self._pil_img:
             return
         self._zoom = max(0.05, min(z, 10.0))
+        label = f"{int(self._zoom * 100)}%"
+        if label != self._zoom_lbl_text:
+            self._zoom_lbl.configure(text=label)
+            self._zoom_lbl_text = label
+        if self._zoom_after:
+            self.after_cancel(self._zoom_after)
+        self._zoom_after = self.after(30, self._do_zoom_render)
+
+    def _do_zoom_render(self):
+        self._zoom_after = None
+        if not self._pil_img:
+            return
         iw, ih = self._pil_img.size
         nw = max(1, int(iw * self._zoom))
         nh = max(1, int(ih * self._zoom))
-        resized = self._pil_img.resize((nw, nh), PILImage.LANCZOS if hasattr(PILImage, 'LANCZOS') else PILImage.BILINEAR)
-        self._tk_img = ImageTk.PhotoImage(resized)
+        cache = self._resize_cache
+        key = (nw, nh)
+        if key in cache:
+            cache.move_to_end(key)
+        else:
+            src = self._pil_img
+            # Integer box-filter shrink first so LANCZOS only runs on a small image
+            factor = int(1 / self._zoom)
+            if factor >= 2 and hasattr(src, "reduce"):
+                try:
+                    src = src.reduce(factor)
+                except Exception:
+                    src = self._pil_img
+            resized = src.resize(key, PILImage.LANCZOS if hasattr(PILImage, 'LANCZOS') else PILImage.BILINEAR)
+            cache[key] = ImageTk.PhotoImage(resized)
+            if len(cache) > 4:
+                cache.popitem(last=False)
+        self._tk_img = cache[key]
         self._img_canvas.delete("all")
         self._img_canvas.create_image(0, 0, anchor="nw", image=self._tk_img)
         self._img_canvas.configure(scrollregion=(0, 0, nw, nh))
-        self._zoom_lbl.configure(text=f"{int(self._zoom * 100)}%")
 
 
 # ── RowWin ───────────────────────────────────────────────────────────────
+# Keys (with Ctrl held) that read-only value Texts still pass through
+_RO_ALLOWED_KEYS = frozenset(("c", "C", "a", "A"))
+
+
+def _csv_line(cells):
+    """One CSV record, quoted like csv.writer's default (QUOTE_MINIMAL) dialect."""
+    if len(cells) == 1 and cells[0] == "":
+        return '""\r\n'
+    out = []
+    for c in cells:
+        if ',' in c or '"' in c or '\n' in c or '\r' in c:
+            c = '"' + c.replace('"', '""') + '"'
+        out.append(c)
+    return ",".join(out) + "\r\n"
+
+
 class RowWin(tk.Toplevel):
-    _pool = {}
+    # (tbl, rid) -> open window; weak values, so the pool never keeps a
+    # closed window (or its thumbnails) alive — _on_close owns lifetime
+    _pool = weakref.WeakValueDictionary()
+    _LAZY_COLS = 50   # tables wider than this build column rows in batches
+    _COL_BATCH = 30
+    _MAX_HL = 500     # most search matches tagged in one value
+    _DISPLAY_MAX = 65536  # chars inserted up front into a value's Text
+    _ro_bound = False     # ROText class bindings registered
 
     @classmethod
     def show(cls, parent, db, tbl, rid, search_term="", match_col=""):
@@ -502,10 +747,10 @@ class RowWin(tk.Toplevel):
                 w.lift()
                 # Re-highlight if search term changed
                 if search_term:
-                    w._highlight_match()
+                    w._schedule_highlight()
                 return w
             except Exception:
-                pass
+                cls._pool.pop(key, None)
         w = cls(parent, db, tbl, rid, search_term, match_col)
         cls._pool[key] = w
         return w
@@ -522,6 +767,15 @@ class RowWin(tk.Toplevel):
         self._match_col = match_col
         self._tk_imgs = []
         self._col_widgets = {}  # col_name -> (row_frame, value_widget)
+        self._row_data = {}
+        self._row_cols = []
+        self._built = 0  # column rows materialized so far
+        self._pending = {}  # col -> (value_frame, placeholder, bg) not yet built
+        self._row_items_cache = None
+        self._blob_types = {}  # col -> blob_type() result
+        self._hl_cap_lbl = None
+        self._hl_after_id = None
+        self._mat_after = None
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
         # Bottom toolbar — grouped, styled buttons
@@ -585,6 +839,7 @@ class RowWin(tk.Toplevel):
         canvas.pack(fill="both", expand=True)
         canvas.bind("<Configure>", lambda e, c=canvas: c.itemconfigure(self._canvas_win, width=e.width))
         self._rw_canvas = canvas
+        self._rw_sb = sb
         def _rw_scroll(e):
             try:
                 canvas.yview_scroll(int(-3 * (e.delta / 120)), "units")
@@ -592,6 +847,13 @@ class RowWin(tk.Toplevel):
                 pass
             return "break"
         self._scroll_fn = _rw_scroll
+        # Every child has this toplevel in its bindtags, so one binding
+        # scrolls the body from anywhere in the window
+        self.bind("<MouseWheel>", _rw_scroll)
+        if not RowWin._ro_bound:
+            self.bind_class("ROText", "<KeyPress>", RowWin._ro_key)
+            self.bind_class("ROText", "<MouseWheel>", RowWin._ro_wheel)
+            RowWin._ro_bound = True
 
         self._populate()
 
@@ -602,104 +864,215 @@ class RowWin(tk.Toplevel):
             return
         self._row_data = data
         self._row_cols = cols
-        for i, col in enumerate(cols):
-            val = data.get(col)
-            bg = C["bg"] if i % 2 == 0 else C["alt"]
-            row_f = tk.Frame(self._body, bg=bg, bd=0)
-            row_f.pack(fill="x", padx=0, pady=0)
-            row_f.columnconfigure(1, weight=1)
-
-            # Column name - full name, no truncation
-            col_lbl = tk.Label(row_f, text=col, font=("Consolas", 8, "bold"),
-                     fg=C["accent"], bg=bg, anchor="nw")
-            col_lbl.grid(row=0, column=0, sticky="nw", padx=(4, 2), pady=1)
-
-            # Value
-            vf = tk.Frame(row_f, bg=bg)
-            vf.grid(row=0, column=1, sticky="nsew", padx=(0, 2), pady=1)
-            val_widget = None  # Track widget for highlighting
-
-            if val is None:
-                tk.Label(vf, text="NULL", fg=C["text2"], bg=bg,
-                         font=("Segoe UI", 9, "italic")).pack(side="left")
-            elif isinstance(val, bytes):
-                bt = blob_type(val)
-                tk.Label(vf, text=f"{bt} ({fmtb(len(val))})",
-                         fg=C["orange"], bg=bg, font=("Segoe UI", 8, "bold")).pack(side="left")
-                tk.Button(vf, text="View", font=("Segoe UI", 7), padx=2, pady=0,
-                          command=lambda v=val, c=col: BlobViewer(self, v, c)).pack(side="left", padx=2)
-                tk.Button(vf, text="Export", font=("Segoe UI", 7), padx=2, pady=0,
-                          command=lambda v=val, c=col: self._export_single(v, c)).pack(side="left", padx=2)
-                if is_image(val) and HAS_PIL:
-                    try:
-                        pimg = PILImage.open(io.BytesIO(val))
-                        pimg.thumbnail((80, 80))
-                        tkimg = ImageTk.PhotoImage(pimg)
-                        self._tk_imgs.append(tkimg)
-                        tk.Label(vf, image=tkimg, bg=bg).pack(side="left", padx=4)
-                    except Exception:
-                        pass
-            else:
-                sv = str(val)
-                is_multiline = '\n' in sv or '\r' in sv
-                if is_multiline or len(sv) > 300:
-                    # Multi-line or long text: Text widget with scrollbar
-                    txt_frame = tk.Frame(vf, bg=bg)
-                    txt_frame.pack(fill="x", expand=True)
-                    line_count = sv.count('\n') + 1
-                    h = min(8, max(2, line_count)) if is_multiline else min(6, max(2, len(sv) // 80))
-                    t = tk.Text(txt_frame, height=h, wrap="word",
-                                font=("Consolas", 9), bg=bg, relief="groove", bd=1)
-                    tsb = ttk.Scrollbar(txt_frame, orient="vertical", command=t.yview)
-                    t.configure(yscrollcommand=tsb.set)
-                    t.insert("1.0", sv)
-                    # Read-only but selectable: block keys except Ctrl+C, Ctrl+A, arrows
-                    t.bind("<Key>", lambda e: None if (e.state & 4 and e.keysym.lower() in ('c', 'a')) else "break")
-                    tsb.pack(side="right", fill="y")
-                    t.pack(side="left", fill="both", expand=True)
-                    val_widget = t
-                else:
-                    # Short single-line text: Entry widget (selectable, copyable, read-only)
-                    e = tk.Entry(vf, font=("Segoe UI", 9), bg=bg, fg=C["text"],
-                                 relief="flat", bd=0, readonlybackground=bg)
-                    e.insert(0, sv)
-                    e.configure(state="readonly")
-                    e.pack(side="left", fill="x", expand=True)
-                    val_widget = e
-                if isinstance(val, (int, float)):
-                    ts = try_decode_timestamp(val)
-                    if ts:
-                        for fmt_name, decoded in ts:
-                            tk.Label(vf, text=f"{fmt_name}: {decoded}",
-                                     fg=C["green"], bg=bg, font=("Segoe UI", 7)).pack(side="left", padx=4)
-
-            # Copy button
-            cpb = tk.Button(row_f, text="Copy", font=("Segoe UI", 7, "bold"),
-                            fg=C["accent"], bg=C["bg2"], activebackground=C["acl"],
-                            relief="flat", bd=0, cursor="hand2", padx=4, pady=1,
-                            command=lambda v=val: self._copy_val(v))
-            cpb.grid(row=0, column=2, sticky="ne", padx=2, pady=1)
-
-            # Track widget for search highlight
-            self._col_widgets[col] = (row_f, col_lbl, val_widget)
-
-        # Bind mousewheel to ALL widgets in this window for smooth scrolling
-        def _bind_scroll_all(w):
-            w.bind("<MouseWheel>", self._scroll_fn)
-            for child in w.winfo_children():
-                _bind_scroll_all(child)
-        _bind_scroll_all(self)
+        if len(cols) > self._LAZY_COLS:
+            # Wide table: build the first batch now, the rest as the user
+            # scrolls towards the bottom of what has been built
+            self._build_rows(self._COL_BATCH)
+        else:
+            self._build_rows(len(cols))
+        self._rw_canvas.configure(yscrollcommand=self._on_body_scroll)
+        self._rw_canvas.bind("<Configure>", self._schedule_materialize, add="+")
 
         # Highlight search match if opened from search results
         if self._search_term and self._match_col:
-            self.after(150, self._highlight_match)
+            self._schedule_highlight()
+
+    def _on_body_scroll(self, first, last):
+        self._rw_sb.set(first, last)
+        if self._built < len(self._row_cols) and float(last) > 0.9:
+            self._build_rows(self._built + self._COL_BATCH)
+        self._schedule_materialize()
+
+    def _build_rows(self, upto):
+        """Materialize column rows up to index *upto*."""
+        upto = min(upto, len(self._row_cols))
+        for i in range(self._built, upto):
+            self._build_col_row(i, self._row_cols[i])
+        self._built = max(self._built, upto)
+
+    def _build_col_row(self, i, col):
+        bg = C["bg"] if i % 2 == 0 else C["alt"]
+        row_f = tk.Frame(self._body, bg=bg, bd=0)
+        row_f.pack(fill="x", padx=0, pady=0)
+        row_f.columnconfigure(1, weight=1)
+
+        # Column name - full name, no truncation
+        col_lbl = tk.Label(row_f, text=col, font=("Consolas", 8, "bold"),
+                 fg=C["accent"], bg=bg, anchor="nw")
+        col_lbl.grid(row=0, column=0, sticky="nw", padx=(4, 2), pady=1)
+
+        # Value
+        vf = tk.Frame(row_f, bg=bg)
+        vf.grid(row=0, column=1, sticky="nsew", padx=(0, 2), pady=1)
+        # Value widgets are built once the row nears the viewport
+        ph = tk.Label(vf, text="\u2026", fg=C["text2"], bg=bg, font=("Segoe UI", 9))
+        ph.pack(side="left")
+        self._pending[col] = (vf, ph, bg)
+
+        # Copy button
+        cpb = ttk.Button(row_f, text="Copy", style="RowCopy.TButton", cursor="hand2",
+                         command=lambda c=col: self._copy_val(self._row_data.get(c)))
+        cpb.grid(row=0, column=2, sticky="ne", padx=2, pady=1)
+
+        # Track widget for search highlight
+        self._col_widgets[col] = (row_f, col_lbl, None)
+
+    def _materialize(self, col):
+        """Replace a row's placeholder with its real value widgets."""
+        entry = self._pending.pop(col, None)
+        if entry is None:
+            return
+        vf, ph, bg = entry
+        ph.destroy()
+        val_widget = self._build_value_widget(col, vf, bg)
+        row_f, col_lbl, _ = self._col_widgets[col]
+        self._col_widgets[col] = (row_f, col_lbl, val_widget)
+
+    def _materialize_visible(self):
+        self._mat_after = None
+        if not self._pending:
+            return
+        try:
+            c = self._rw_canvas
+            top = c.canvasy(0) - 200
+            bottom = c.canvasy(c.winfo_height()) + 200
+            for col in list(self._pending):
+                row_f = self._col_widgets[col][0]
+                y = row_f.winfo_y()
+                if y + row_f.winfo_height() >= top and y <= bottom:
+                    self._materialize(col)
+        except Exception:
+            pass
+
+    def _schedule_materialize(self, event=None):
+        if self._pending and not self._mat_after:
+            self._mat_after = self.after_idle(self._materialize_visible)
+
+    def _build_value_widget(self, col, vf, bg):
+        val = self._row_data.get(col)
+        val_widget = None  # Track widget for highlighting
+
+        if val is None:
+            tk.Label(vf, text="NULL", fg=C["text2"], bg=bg,
+                     font=("Segoe UI", 9, "italic")).pack(side="left")
+        elif isinstance(val, bytes):
+            bt = self._blob_type(col)
+            tk.Label(vf, text=f"{bt} ({fmtb(len(val))})",
+                     fg=C["orange"], bg=bg, font=("Segoe UI", 8, "bold")).pack(side="left")
+            tk.Button(vf, text="View", font=("Segoe UI", 7), padx=2, pady=0,
+                      command=lambda c=col: BlobViewer(self, self._row_data[c], c)).pack(side="left", padx=2)
+            tk.Button(vf, text="Export", font=("Segoe UI", 7), padx=2, pady=0,
+                      command=lambda c=col: self._export_single(self._row_data[c], c)).pack(side="left", padx=2)
+            if is_image(val) and HAS_PIL:
+                try:
+                    pimg = PILImage.open(io.BytesIO(val))
+                    # Let the JPEG decoder scale down via DCT, then box-reduce
+                    # so the final resize works on a small image.  reduce()
+                    # rejects palette and 1-bit images (GIFs, palette PNGs),
+                    # so those go straight to thumbnail()
+                    pimg.draft("RGB", (160, 160))
+                    w, h = pimg.size
+                    factor = min(w // 80, h // 80)
+                    if factor > 1 and pimg.mode not in ("P", "1"):
+                        pimg = pimg.reduce(factor)
+                    pimg.thumbnail((80, 80), PILImage.BILINEAR)
+                    tkimg = ImageTk.PhotoImage(pimg)
+                    self._tk_imgs.append(tkimg)
+                    tk.Label(vf, image=tkimg, bg=bg).pack(side="left", padx=4)
+                except Exception:
+                    pass
+        else:
+            sv = str(val)
+            sv_len = len(sv)
+            sv_nl = sv.count('\n')
+            is_multiline = sv_nl > 0 or '\r' in sv
+            if is_multiline or sv_len > 300:
+                # Multi-line or long text: Text widget with scrollbar
+                txt_frame = tk.Frame(vf, bg=bg)
+                txt_frame.pack(fill="x", expand=True)
+                h = min(8, max(2, sv_nl + 1)) if is_multiline else min(6, max(2, sv_len // 80))
+                t = tk.Text(txt_frame, height=h, wrap="word",
+                            font=("Consolas", 9), bg=bg, relief="groove", bd=1)
+                tsb = ttk.Scrollbar(txt_frame, orient="vertical", command=t.yview)
+                t.configure(yscrollcommand=tsb.set)
+                if sv_len > self._DISPLAY_MAX:
+                    # Bound the up-front Tk insert; the rest loads on request
+                    t.insert("1.0", sv[:self._DISPLAY_MAX])
+                    t.insert("end", f"\n\u2026 [{sv_len - self._DISPLAY_MAX:,} more characters "
+                                    f"truncated \u2014 click Copy for full value]")
+                    full_btn = tk.Button(vf, text="Show full", font=("Segoe UI", 7), padx=2, pady=0)
+                    full_btn.configure(command=lambda t=t, sv=sv, b=full_btn: self._show_full(t, sv, b))
+                    full_btn.pack(side="bottom", anchor="w", pady=(1, 0))
+                else:
+                    t.insert("1.0", sv)
+                # Read-only but selectable, wheel scrolls the body: both come
+                # from the shared ROText class bindings placed ahead of Text's
+                tags = t.bindtags()
+                t.bindtags((tags[0], "ROText") + tags[1:])
+                tsb.pack(side="right", fill="y")
+                t.pack(side="left", fill="both", expand=True)
+                val_widget = t
+            else:
+                # Short single-line text: Entry widget (selectable, copyable, read-only)
+                e = tk.Entry(vf, font=("Segoe UI", 9), bg=bg, fg=C["text"],
+                             relief="flat", bd=0, readonlybackground=bg)
+                e.insert(0, sv)
+                e.configure(state="readonly")
+                e.pack(side="left", fill="x", expand=True)
+                val_widget = e
+            if isinstance(val, (int, float)):
+                ts = _cached_try_decode_timestamp(val)
+                if ts:
+                    for fmt_name, decoded in ts:
+                        tk.Label(vf, text=f"{fmt_name}: {decoded}",
+                                 fg=C["green"], bg=bg, font=("Segoe UI", 7)).pack(side="left", padx=4)
+        return val_widget
+
+    def _schedule_highlight(self):
+        """Coalesce highlight requests into one run 150 ms after the last."""
+        if self._hl_after_id:
+            self.after_cancel(self._hl_after_id)
+        self._hl_after_id = self.after(150, self._run_highlight)
+
+    def _run_highlight(self):
+        self._hl_after_id = None
+        try:
+            if not self.winfo_exists():
+                return
+        except Exception:
+            return
+        self._highlight_match()
+
+    @staticmethod
+    def _ro_key(e):
+        # Block editing keys; only Ctrl+C / Ctrl+A reach the Text bindings
+        if e.state & 4 and e.keysym in _RO_ALLOWED_KEYS:
+            return None
+        return "break"
+
+    @staticmethod
+    def _ro_wheel(e):
+        # Scroll the owning RowWin's body instead of the value Text
+        try:
+            return e.widget.winfo_toplevel()._scroll_fn(e)
+        except Exception:
+            return "break"
+
+    @staticmethod
+    def _show_full(t, sv, btn):
+        t.delete("1.0", "end")
+        t.insert("1.0", sv)
+        btn.destroy()
 
     def _highlight_match(self):
         """Scroll to and highlight the matched column/term from search."""
         col = self._match_col
         term = self._search_term
-        if not col or not term or col not in self._col_widgets:
+        if not col or not term or col not in self._row_data:
             return
+        if col not in self._col_widgets:
+            self._build_rows(self._row_cols.index(col) + 1)
+        self._materialize(col)
         row_f, col_lbl, val_widget = self._col_widgets[col]
 
         # Highlight column name label with accent background
@@ -725,37 +1098,38 @@ class RowWin(tk.Toplevel):
         if isinstance(val_widget, tk.Text):
             # Tag-based highlight in Text widget
             val_widget.tag_configure("search_hl", background="#ff6b00", foreground="white")
-            content = val_widget.get("1.0", "end-1c")
-            tl = term.lower()
-            cl = content.lower()
-            start_idx = 0
-            first_pos = None
-            while True:
-                pos = cl.find(tl, start_idx)
-                if pos == -1:
-                    break
-                # Convert char offset to Text index
-                line = content[:pos].count('\n') + 1
-                col_off = pos - content[:pos].rfind('\n') - 1
-                end_pos = pos + len(term)
-                end_line = content[:end_pos].count('\n') + 1
-                end_col = end_pos - content[:end_pos].rfind('\n') - 1
-                tag_start = f"{line}.{col_off}"
-                tag_end = f"{end_line}.{end_col}"
-                val_widget.tag_add("search_hl", tag_start, tag_end)
-                if first_pos is None:
-                    first_pos = tag_start
-                start_idx = pos + 1
-            # Scroll Text widget to first match
-            if first_pos:
-                val_widget.see(first_pos)
+            # One C-level search for every (overlapping) match start; the
+            # end of each span is an index expression Tk resolves itself
+            starts = [str(i) for i in val_widget.tk.splitlist(val_widget.tk.call(
+                val_widget._w, "search", "-all", "-overlap", "-nocase", "--",
+                term, "1.0", "end"))]
+            if starts:
+                # Tag at most _MAX_HL spans; each tag range costs Tk tree work
+                capped = len(starts) > self._MAX_HL
+                if capped:
+                    starts = starts[:self._MAX_HL]
+                n = len(term)
+                spans = []
+                for idx in starts:
+                    spans.append(idx)
+                    spans.append(f"{idx}+{n}c")
+                val_widget.tag_add("search_hl", *spans)
+                # Scroll Text widget to first match
+                val_widget.see(starts[0])
+                if capped and self._hl_cap_lbl is None:
+                    self._hl_cap_lbl = tk.Label(row_f, text=f"showing first {self._MAX_HL} matches",
+                                                fg=C["text2"], bg=row_f.cget("bg"),
+                                                font=("Segoe UI", 7, "italic"))
+                    self._hl_cap_lbl.grid(row=1, column=1, sticky="w", padx=(0, 2))
         elif isinstance(val_widget, tk.Entry):
-            # Entry widget: select the matched text
-            content = val_widget.get()
-            pos = content.lower().find(term.lower())
-            if pos >= 0:
+            # Entry widget: select the matched text. A case-insensitive regex
+            # avoids lowercased copies and keeps offsets valid for the original
+            # text even where lower() would change its length
+            m = re.search(re.escape(term), val_widget.get(), re.IGNORECASE)
+            if m:
+                pos = m.start()
                 val_widget.configure(state="normal")
-                val_widget.selection_range(pos, pos + len(term))
+                val_widget.selection_range(pos, m.end())
                 val_widget.icursor(pos)
                 val_widget.xview(pos)
                 val_widget.configure(state="readonly")
@@ -763,7 +1137,7 @@ class RowWin(tk.Toplevel):
     def _copy_val(self, v):
         self.clipboard_clear()
         if isinstance(v, bytes):
-            self.clipboard_append(binascii.hexlify(v).decode())
+            self.clipboard_append(v.hex())
         elif v is None:
             self.clipboard_append("NULL")
         else:
@@ -783,8 +1157,15 @@ class RowWin(tk.Toplevel):
         self.clipboard_append(_build_schema_text(self._db, self._tbl))
         self._flash("Copied Schema")
 
+    def _blob_type(self, col):
+        """Sniffed type of a BLOB column, computed once per window."""
+        bt = self._blob_types.get(col)
+        if bt is None:
+            bt = self._blob_types[col] = blob_type(self._row_data.get(col))
+        return bt
+
     def _export_single(self, data, col):
-        bt = blob_type(data)
+        bt = self._blob_type(col)
         ext = _EXT_MAP.get(bt, ".bin")
         path = filedialog.asksaveasfilename(defaultextension=ext,
                                              initialfile=f"{self._tbl}_{col}{ext}")
@@ -801,43 +1182,35 @@ class RowWin(tk.Toplevel):
         self.title(msg)
         self.after(1500, lambda: self.title(orig))
 
+    def _row_items(self):
+        """(col, value, blob_label) per column, built once and shared by the Copy formats."""
+        if self._row_items_cache is None:
+            items = []
+            for c in self._row_cols:
+                v = self._row_data.get(c)
+                items.append((c, v, f"[BLOB {fmtb(len(v))}]" if isinstance(v, bytes) else None))
+            self._row_items_cache = items
+        return self._row_items_cache
+
     def _copy_json(self):
         self.clipboard_clear()
-        d = {}
-        for c in self._row_cols:
-            v = self._row_data.get(c)
-            if isinstance(v, bytes):
-                d[c] = f"[BLOB {fmtb(len(v))}]"
-            else:
-                d[c] = v
+        d = {c: (v if bl is None else bl) for c, v, bl in self._row_items()}
         self.clipboard_append(json.dumps(d, indent=2, default=str))
         self._flash("Copied JSON")
 
     def _copy_csv(self):
         self.clipboard_clear()
-        out = io.StringIO()
-        w = csv.writer(out)
-        w.writerow(self._row_cols)
-        vals = []
-        for c in self._row_cols:
-            v = self._row_data.get(c)
-            if isinstance(v, bytes):
-                vals.append(f"[BLOB {fmtb(len(v))}]")
-            elif v is None:
-                vals.append("")
-            else:
-                vals.append(str(v))
-        w.writerow(vals)
-        self.clipboard_append(out.getvalue())
+        vals = [bl if bl is not None else ("" if v is None else str(v))
+                for _, v, bl in self._row_items()]
+        self.clipboard_append(_csv_line(self._row_cols) + _csv_line(vals))
         self._flash("Copied CSV")
 
     def _copy_text(self):
         self.clipboard_clear()
         lines = []
-        for c in self._row_cols:
-            v = self._row_data.get(c)
-            if isinstance(v, bytes):
-                lines.append(f"{c}: [BLOB {fmtb(len(v))}]")
+        for c, v, bl in self._row_items():
+            if bl is not None:
+                lines.append(f"{c}: {bl}")
             elif v is None:
                 lines.append(f"{c}: NULL")
             else:
@@ -845,30 +1218,46 @@ class RowWin(tk.Toplevel):
         self.clipboard_append("\n".join(lines))
         self._flash("Copied Text")
 
+    @staticmethod
+    def _write_blob(path, data):
+        # Unbuffered write straight from the in-memory blob
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            mv = memoryview(data)
+            while mv:
+                mv = mv[os.write(fd, mv):]
+        finally:
+            os.close(fd)
+
     def _export_blobs(self):
         folder = filedialog.askdirectory(title="Select folder for BLOBs")
         if not folder:
             return
-        count = 0
+        prefix = os.path.join(folder, f"{self._tbl}_r{self._rid}_")
+        jobs = []
         for c in self._row_cols:
             v = self._row_data.get(c)
             if isinstance(v, bytes) and len(v) > 0:
-                bt = blob_type(v)
-                ext = _EXT_MAP.get(bt, ".bin")
-                fname = f"{self._tbl}_r{self._rid}_{c}{ext}"
-                try:
-                    with open(os.path.join(folder, fname), "wb") as f:
-                        f.write(v)
-                    count += 1
-                except Exception:
-                    pass
+                jobs.append((prefix + c + _EXT_MAP.get(self._blob_type(c), ".bin"), v))
+
+        def _one(job):
+            try:
+                self._write_blob(*job)
+                return True
+            except Exception:
+                return False
+
+        count = 0
+        if jobs:
+            # Disk writes release the GIL, so overlap them across files
+            with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as pool:
+                count = sum(pool.map(_one, jobs))
         if count > 0:
             self._flash(f"Exported {count} BLOB(s)")
         else:
             messagebox.showinfo("Export", "No BLOBs found in this row")
 
     def _on_close(self):
-        key = (self._tbl, self._rid)
-        if key in RowWin._pool:
-            del RowWin._pool[key]
+        RowWin._pool.pop((self._tbl, self._rid), None)
+        self._tk_imgs.clear()
         self.destroy()
@@ -2,11 +2,26 @@
 
 import re
 import os
+import time
 import html as _html
+from codecs import utf_8_decode as _utf8_decode
+from functools import lru_cache
 from datetime import datetime, timezone, timedelta
 
 from constants import _SIGS, _EXT_MAP, VERSION
 
+try:
+    from re import _parser as _sre_parse, _constants as _sre_const
+except ImportError:  # Python < 3.11
+    import sre_parse as _sre_parse
+    import sre_constants as _sre_const
+
+_LITERAL = _sre_const.LITERAL
+_SUBPATTERN = _sre_const.SUBPATTERN
+_BRANCH = _sre_const.BRANCH
+_ASSERTS = (_sre_const.ASSERT, _sre_const.ASSERT_NOT)
+_REPEATS = (_sre_const.MAX_REPEAT, _sre_const.MIN_REPEAT)
+
 
 # ── utility functions ────────────────────────────────────────────────────
 def _q(s):
@@ -17,6 +32,74 @@ def _le(s):
     """Escape string for LIKE."""
     return s.replace("\\", "\\\\").replace("%", r"\%").replace("_", r"\_")
 
+@lru_cache(maxsize=256)
+def _cached_compile(pattern):
+    """re.compile with a private cache, skipping re's own per-call lookup."""
+    return re.compile(pattern)
+
+@lru_cache(maxsize=512)
+def _parse_pattern(pattern):
+    """Parse a regex into its sre tree once; raises like re.compile on bad input."""
+    return _sre_parse.parse(pattern)
+
+_HINT_ENOUGH = 32
+
+def _literal_runs(items):
+    """Yield runs of guaranteed literal characters."""
+    buf = []
+    for op, av in items:
+        if op == _LITERAL:
+            buf.append(chr(av))
+        elif op == _SUBPATTERN:
+            # Group (...) — recurse; merge literals across group boundary
+            sub_runs = list(_literal_runs(av[-1]))
+            if sub_runs:
+                # Attach first sub-run to current buffer (continuity)
+                buf.append(sub_runs[0])
+                if len(sub_runs) > 1:
+                    # Group had internal breaks — yield merged first part,
+                    # yield middle runs, keep last for continuation
+                    yield ''.join(buf)
+                    buf = []
+                    for run in sub_runs[1:-1]:
+                        yield run
+                    buf.append(sub_runs[-1])
+        elif op in _ASSERTS:
+            # Lookahead / lookbehind — zero-width, skip entirely
+            if buf:
+                yield ''.join(buf)
+                buf = []
+        elif op in _REPEATS:
+            min_count, _max_count, sub = av
+            if min_count >= 1:
+                sub_runs = list(_literal_runs(sub))
+                # Single repeated literal char — include min_count copies
+                if len(sub_runs) == 1 and len(sub_runs[0]) == 1:
+                    buf.append(sub_runs[0] * min_count)
+                else:
+                    if buf:
+                        yield ''.join(buf)
+                        buf = []
+                    yield from sub_runs
+            else:
+                # min=0 (optional) — can't guarantee presence
+                if buf:
+                    yield ''.join(buf)
+                    buf = []
+        elif op == _BRANCH:
+            # Nested alternation — break
+            if buf:
+                yield ''.join(buf)
+                buf = []
+        else:
+            # IN, ANY, NOT_LITERAL, AT, GROUPREF, etc. — non-literal
+            if buf:
+                yield ''.join(buf)
+                buf = []
+    if buf:
+        yield ''.join(buf)
+
+@lru_cache(maxsize=256)
 def _regex_literal_hint(pattern):
     """Extract the longest guaranteed literal substring from a regex for LIKE pre-filter.
 
@@ -25,101 +108,85 @@ def _regex_literal_hint(pattern):
     Returns "" if no useful literal substring can be extracted.
     """
     try:
-        from re import _parser as _sp, _constants as _sc
-    except ImportError:
-        import sre_parse as _sp, sre_constants as _sc
-
-    try:
-        parsed = _sp.parse(pattern)
+        parsed = _parse_pattern(pattern)
     except Exception:
         return ""
 
-    LITERAL = _sc.LITERAL
-    SUBPATTERN = _sc.SUBPATTERN
-    BRANCH = _sc.BRANCH
-    ASSERT = _sc.ASSERT
-    ASSERT_NOT = _sc.ASSERT_NOT
-    MAX_REPEAT = _sc.MAX_REPEAT
-    MIN_REPEAT = _sc.MIN_REPEAT
-
     # Top-level alternation — no single hint works
-    if len(parsed) == 1 and parsed[0][0] == BRANCH:
-        return ""
     for op, _ in parsed:
-        if op == BRANCH:
+        if op == _BRANCH:
             return ""
 
-    def _walk(items):
-        """Yield runs of guaranteed literal characters."""
-        buf = []
-        for op, av in items:
-            if op == LITERAL:
-                buf.append(chr(av))
-            elif op == SUBPATTERN:
-                # Group (...) — recurse; merge literals across group boundary
-                sub_runs = list(_walk(av[-1]))
-                if sub_runs:
-                    # Attach first sub-run to current buffer (continuity)
-                    buf.append(sub_runs[0])
-                    if len(sub_runs) > 1:
-                        # Group had internal breaks — yield merged first part,
-                        # yield middle runs, keep last for continuation
-                        yield ''.join(buf)
-                        buf = []
-                        for run in sub_runs[1:-1]:
-                            yield run
-                        buf.append(sub_runs[-1])
-            elif op in (ASSERT, ASSERT_NOT):
-                # Lookahead / lookbehind — zero-width, skip entirely
-                if buf:
-                    yield ''.join(buf)
-                    buf = []
-            elif op in (MAX_REPEAT, MIN_REPEAT):
-                min_count, _max_count, sub = av
-                if min_count >= 1:
-                    sub_runs = list(_walk(sub))
-                    # Single repeated literal char — include min_count copies
-                    if len(sub_runs) == 1 and len(sub_runs[0]) == 1:
-                        buf.append(sub_runs[0] * min_count)
-                    else:
-                        if buf:
-                            yield ''.join(buf)
-                            buf = []
-                        yield from sub_runs
-                else:
-                    # min=0 (optional) — can't guarantee presence
-                    if buf:
-                        yield ''.join(buf)
-                        buf = []
-            elif op == BRANCH:
-                # Nested alternation — break
-                if buf:
-                    yield ''.join(buf)
-                    buf = []
-            else:
-                # IN, ANY, NOT_LITERAL, AT, GROUPREF, etc. — non-literal
-                if buf:
-                    yield ''.join(buf)
-                    buf = []
-        if buf:
-            yield ''.join(buf)
+    # Stream the runs, keeping the first longest; a run of _HINT_ENOUGH
+    # chars is already as selective as LIKE needs, so stop walking there
+    best = ""
+    for run in _literal_runs(parsed):
+        if len(run) > len(best):
+            best = run
+            if len(best) >= _HINT_ENOUGH:
+                break
+    return best
+
+_HEX_DIGITS = frozenset("0123456789abcdef")
+_HEX_WINDOW = 65536
+
+def _hex_match(data, term):
+    """True if ``term`` occurs in the hex dump of ``data`` (case-insensitive).
+
+    Equivalent to ``term.lower() in binascii.hexlify(data).decode()`` but
+    searches the raw bytes with ``bytes.find`` instead of materialising a
+    hex copy twice the size of the blob. A hex-dump match may start on
+    either nibble of a byte, so both alignments are checked.
+    """
+    t = term.lower()
+    if not t or not _HEX_DIGITS.issuperset(t):
+        return False  # a hex dump only ever contains [0-9a-f]
+    if len(t) < 3:
+        # Too short for a whole-byte core — scan the dump in bounded windows
+        step = _HEX_WINDOW
+        for i in range(0, len(data), step):
+            if t in data[i:i + step + 1].hex():
+                return True
+        return False
+    n = len(data)
+    for head_len in (0, 1):
+        head = t[:head_len]           # low nibble of the byte before core
+        rest = t[head_len:]
+        core_len = len(rest) & ~1
+        core = bytes.fromhex(rest[:core_len])
+        tail = rest[core_len:]        # high nibble of the byte after core
+        head_v = int(head, 16) if head else -1
+        tail_v = int(tail, 16) if tail else -1
+        pos = data.find(core)
+        while pos != -1:
+            end = pos + len(core)
+            if ((head_v < 0 or (pos > 0 and data[pos - 1] & 0x0F == head_v)) and
+                    (tail_v < 0 or (end < n and data[end] >> 4 == tail_v))):
+                return True
+            pos = data.find(core, pos + 1)
+    return False
 
-    runs = list(_walk(parsed))
-    if not runs:
-        return ""
-    return max(runs, key=len)
+_FMTB_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
 
 def fmtb(b):
     """Format byte count."""
     if b is None:
         return "0B"
-    for unit in ("B", "KB", "MB", "GB", "TB"):
-        if abs(b) < 1024.0:
-            if unit == "B":
-                return f"{int(b)}{unit}"
-            return f"{b:.1f}{unit}"
-        b /= 1024.0
-    return f"{b:.1f}PB"
+    try:
+        n = abs(int(b))
+    except (OverflowError, ValueError):  # inf / nan
+        return f"{b:.1f}PB"
+    # Unit index straight from the bit length: 1024**idx <= n < 1024**(idx+1)
+    idx = min((n.bit_length() - 1) // 10, 5) if n else 0
+    if not idx:
+        return f"{int(b)}B"
+    if type(b) is int:
+        # Tenths in integer arithmetic, rounded half-to-even like :.1f
+        q, r = divmod(n * 10, 1 << (idx * 10))
+        if 2 * r > 1 << (idx * 10) or (2 * r == 1 << (idx * 10) and q & 1):
+            q += 1
+        return f"{'-' if b < 0 else ''}{q // 10}.{q % 10}{_FMTB_UNITS[idx]}"
+    return f"{b / (1 << (idx * 10)):.1f}{_FMTB_UNITS[idx]}"
 
 def tr(s, n=220):
     """Truncate string."""
@@ -128,6 +195,12 @@ def tr(s, n=220):
     s = str(s)
     return s[:n] + "..." if len(s) > n else s
 
+# Maps control bytes other than tab/LF/CR to 0x01, everything else to 0x00
+_CTRL_TABLE = bytes(1 if i < 32 and i not in (9, 10, 13) else 0 for i in range(256))
+
+# Bytes enough for 200 UTF-8 chars (<= 4 bytes each) plus a split tail
+_VB_HEAD = 804
+
 def vb(v):
     """Browse display value."""
     if v is None:
@@ -139,10 +212,17 @@ def vb(v):
             return f"[{bt} {fmtb(len(v))}]"
         # Unknown type — try UTF-8 decode (many DBs store text in BLOB columns)
         try:
-            decoded = v.decode("utf-8")
+            # Vet the first 200 chars from a bounded prefix before paying for
+            # a full decode; a split trailing sequence is left for later
+            whole = len(v) <= _VB_HEAD
+            head = _utf8_decode(v[:_VB_HEAD], "strict", whole)[0][:200]
             # Reject if too many control chars (likely binary, not text)
-            ctrl = sum(1 for ch in decoded[:200] if ord(ch) < 32 and ch not in '\n\r\t')
-            if ctrl <= 2:
+            # Control chars are single UTF-8 bytes, so count them on the raw
+            # bytes of the first 200 chars via a C-level translate
+            raw = v[:200] if head.isascii() else head.encode("utf-8")
+            if raw.translate(_CTRL_TABLE).count(b'\x01') <= 2:
+                # The whole blob must still be valid UTF-8 to show as text
+                decoded = v.decode("utf-8")
                 if len(decoded) <= 500:
                     return decoded
                 return decoded[:300] + "..."
@@ -152,6 +232,9 @@ def vb(v):
     s = str(v)
     return s[:300] + "..." if len(s) > 300 else s
 
+# Inline flag group that may turn on IGNORECASE, e.g. (?i) or (?i:...)
+_ICASE_FLAG_RX = re.compile(r"\(\?[aiLmsux-]*i")
+
 def _snippet(text, term, mode_key, ctx=150):
     """Extract snippet of text around where term matches, for search display."""
     if text is None:
@@ -162,7 +245,14 @@ def _snippet(text, term, mode_key, ctx=150):
     # Find match position
     if mode_key == "rx":
         try:
-            m = re.search(term, s)
+            rx = _cached_compile(term)
+            # Every match contains the literal hint, so a plain find() rules
+            # out non-matching text cheaply; not valid under (?i)
+            if not (rx.flags & re.IGNORECASE or _ICASE_FLAG_RX.search(term)):
+                hint = _regex_literal_hint(term)
+                if hint and s.find(hint) == -1:
+                    return s[:400] + "..."
+            m = rx.search(s)
             pos = m.start() if m else -1
         except Exception:
             pos = -1
@@ -205,53 +295,140 @@ def _int_count(rc, default=0):
             pass
     return default
 
+# Signatures bucketed by their first two bytes (the shortest signature
+# length), in _SIGS order within each bucket
+_SIG_TABLE = {}
+for _sig, _name in _SIGS:
+    _SIG_TABLE.setdefault(_sig[:2], []).append((_sig, _name))
+del _sig, _name
+
+# Protobuf first-byte classes: 1 = varint tag, 2 = length-delimited tag
+_PB_FIRST = bytes((1 if i & 7 == 0 else 2 if i & 7 == 2 else 0) if i >> 3 else 0
+                  for i in range(256))
+
+# Displayable image signatures (RIFF additionally needs WEBP at offset 8)
+_IMG_MAGICS = (b'\xff\xd8\xff', b'\x89PNG\r\n\x1a\n', b'GIF8', b'BM')
+
 def blob_type(data):
     """Detect blob type from magic bytes."""
-    if not data or not isinstance(data, bytes):
+    if not isinstance(data, bytes):
+        return "BLOB"
+    n = len(data)
+    if n < 2:  # shorter than any signature or protobuf tag + value
         return "BLOB"
-    for sig, name in _SIGS:
-        if data[:len(sig)] == sig:
-            if name == "RIFF" and len(data) >= 12 and data[8:12] == b'WEBP':
+    for sig, name in _SIG_TABLE.get(data[:2], ()):
+        if data.startswith(sig):
+            if name == "RIFF" and data.startswith(b'WEBP', 8):
                 return "WEBP"
             return name
     # ftyp at offset 4 for MP4/HEIF
-    if len(data) >= 8:
-        ftyp = data[4:8]
-        if ftyp == b'ftyp':
-            brand = data[8:12] if len(data) >= 12 else b''
-            if brand in (b'heic', b'heix', b'hevc', b'mif1'):
-                return "HEIF"
-            return "MP4"
-    # protobuf heuristic
-    if len(data) >= 2 and (data[0] & 0x07) in (0, 1, 2, 5) and data[0] >> 3 > 0:
-        try:
-            tag = data[0]
-            wt = tag & 0x07
-            if wt == 0 and len(data) >= 2:
-                return "Protobuf?"
-            if wt == 2 and len(data) >= 3:
-                ln = data[1]
-                if 0 < ln < len(data):
-                    return "Protobuf?"
-        except Exception:
-            pass
+    if data.startswith(b'ftyp', 4):
+        if data[8:12] in (b'heic', b'heix', b'hevc', b'mif1'):
+            return "HEIF"
+        return "MP4"
+    # protobuf heuristic: first byte is a field tag (field >= 1); varint
+    # (wire type 0) qualifies as is, length-delimited (2) needs a sane length
+    kind = _PB_FIRST[data[0]]
+    if kind == 1 or (kind == 2 and n >= 3 and 0 < data[1] < n):
+        return "Protobuf?"
     return "BLOB"
 
 def is_image(data):
     """Check if data is a displayable image."""
     if not data or not isinstance(data, bytes):
         return False
-    if data[:3] == b'\xff\xd8\xff':
-        return True
-    if data[:8] == b'\x89PNG\r\n\x1a\n':
-        return True
-    if data[:4] in (b'GIF8',):
-        return True
-    if data[:2] == b'BM':
+    if data.startswith(_IMG_MAGICS):
         return True
-    if len(data) >= 12 and data[:4] == b'RIFF' and data[8:12] == b'WEBP':
-        return True
-    return False
+    return data.startswith(b'RIFF') and data.startswith(b'WEBP', 8)
+
+_MAC_EPOCH = datetime(2001, 1, 1, tzinfo=timezone.utc)
+_WIN_EPOCH = datetime(1601, 1, 1, tzinfo=timezone.utc)
+_MAC_OFFSET = 978307200        # 2001-01-01 in Unix seconds
+_WIN_OFFSET = -11644473600     # 1601-01-01 in Unix seconds
+
+def _civil_from_days(z):
+    """(year, month, day) for days since 1970-01-01 (Hinnant's algorithm)."""
+    z += 719468
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    m = mp + 3 if mp < 10 else mp - 9
+    return yoe + era * 400 + (m <= 2), m, doy - (153 * mp + 2) // 5 + 1
+
+def _fmt_utc(secs, y_min, frac=" UTC"):
+    """Format integer Unix seconds as 'Y-m-d H:M:S' + frac, None outside y_min..2099."""
+    days, sod = divmod(secs, 86400)
+    y, m, d = _civil_from_days(days)
+    if not y_min <= y <= 2099:
+        return None
+    hh, rem = divmod(sod, 3600)
+    return f"{y:04d}-{m:02d}-{d:02d} {hh:02d}:{rem // 60:02d}:{rem % 60:02d}{frac}"
+
+# Integer values (the usual case for stored timestamps) are formatted with
+# integer arithmetic; floats keep the datetime path for its µs rounding.
+def _ts_unix_s(v):
+    if type(v) is int:
+        return _fmt_utc(v, 2000)
+    dt = datetime.fromtimestamp(v, tz=timezone.utc)
+    if 2000 <= dt.year <= 2099:
+        return dt.strftime("%Y-%m-%d %H:%M:%S UTC")
+
+def _ts_unix_ms(v):
+    if type(v) is int:
+        secs, ms = divmod(v, 1000)
+        return _fmt_utc(secs, 2000, f".{ms:03d}000 ")
+    dt = datetime.fromtimestamp(v / 1000.0, tz=timezone.utc)
+    if 2000 <= dt.year <= 2099:
+        return dt.strftime("%Y-%m-%d %H:%M:%S.%f UTC")[:-3]
+
+def _ts_unix_us(v):
+    if type(v) is int:
+        secs, us = divmod(v, 1000000)
+        return _fmt_utc(secs, 2000, f".{us:06d} UTC")
+    dt = datetime.fromtimestamp(v / 1e6, tz=timezone.utc)
+    if 2000 <= dt.year <= 2099:
+        return dt.strftime("%Y-%m-%d %H:%M:%S.%f UTC")
+
+def _ts_mac(v):
+    if type(v) is int:
+        return _fmt_utc(v + _MAC_OFFSET, 2002)
+    dt = _MAC_EPOCH + timedelta(seconds=v)
+    if 2002 <= dt.year <= 2099:
+        return dt.strftime("%Y-%m-%d %H:%M:%S UTC")
+
+def _ts_webkit(v):
+    if type(v) is int:
+        return _fmt_utc(v // 1000000 + _WIN_OFFSET, 1970)
+    dt = _WIN_EPOCH + timedelta(microseconds=v)
+    if 1970 <= dt.year <= 2099:
+        return dt.strftime("%Y-%m-%d %H:%M:%S UTC")
+
+def _ts_filetime(v):
+    if type(v) is int:
+        # 100ns ticks to whole µs, half-to-even like timedelta
+        us, r = divmod(v, 10)
+        if r > 5 or (r == 5 and us & 1):
+            us += 1
+        return _fmt_utc(us // 1000000 + _WIN_OFFSET, 1970)
+    dt = _WIN_EPOCH + timedelta(microseconds=v / 10)
+    if 1970 <= dt.year <= 2099:
+        return dt.strftime("%Y-%m-%d %H:%M:%S UTC")
+
+# (low, high, label, decoder), checked as low < v < high in display order.
+# Ranges overlap (e.g. Unix seconds vs Mac Absolute), so every bucket that
+# contains v is tried. Unix seconds' bound is effectively >= 946684800
+# because smaller values are rejected up front.
+_TS_FORMATS = (
+    (946684799, 4102444800, "Unix seconds", _ts_unix_s),
+    (9.46e11, 4.1e15, "Unix ms", _ts_unix_ms),
+    (9.46e14, 4.1e18, "Unix \u00b5s", _ts_unix_us),
+    # Mac/Cocoa Absolute Time; minimum ~1 year after epoch
+    (31536000, 1e10, "Mac Absolute", _ts_mac),
+    (1e16, 1.5e17, "Chrome/WebKit", _ts_webkit),
+    (1e17, 3e18, "Windows FILETIME", _ts_filetime),
+)
 
 def try_decode_timestamp(val):
     """Try to decode numeric value as various timestamp formats.
@@ -262,64 +439,27 @@ def try_decode_timestamp(val):
     v = val
     # Skip small values — IDs, row counts, pixel sizes, file sizes < 10MB
     # Unix timestamp 946684800 = 2000-01-01, a sane minimum for modern data
-    if isinstance(v, int) and -100000 < v < 946684800:
+    if -100000 < v < 946684800:
         return None
-    if isinstance(v, float) and -100000 < v < 946684800:
-        return None
-    results = []
-    try:
-        # Unix seconds (2000-01-01 to 2099-12-31)
-        if 946684800 <= v < 4102444800:
-            dt = datetime.fromtimestamp(v, tz=timezone.utc)
-            if 2000 <= dt.year <= 2099:
-                results.append(("Unix seconds", dt.strftime("%Y-%m-%d %H:%M:%S UTC")))
-    except (OSError, OverflowError, ValueError):
-        pass
-    try:
-        # Unix milliseconds
-        if 9.46e11 < v < 4.1e15:
-            dt = datetime.fromtimestamp(v / 1000.0, tz=timezone.utc)
-            if 2000 <= dt.year <= 2099:
-                results.append(("Unix ms", dt.strftime("%Y-%m-%d %H:%M:%S.%f UTC")[:-3]))
-    except (OSError, OverflowError, ValueError):
-        pass
-    try:
-        # Unix microseconds
-        if 9.46e14 < v < 4.1e18:
-            dt = datetime.fromtimestamp(v / 1e6, tz=timezone.utc)
-            if 2000 <= dt.year <= 2099:
-                results.append(("Unix \u00b5s", dt.strftime("%Y-%m-%d %H:%M:%S.%f UTC")))
-    except (OSError, OverflowError, ValueError):
-        pass
-    try:
-        # Mac/Cocoa Absolute Time (seconds since 2001-01-01)
-        # Minimum ~1 year after epoch to avoid small-number false positives
-        mac_epoch = datetime(2001, 1, 1, tzinfo=timezone.utc)
-        if 31536000 < v < 1e10:
-            dt = mac_epoch + timedelta(seconds=v)
-            if 2002 <= dt.year <= 2099:
-                results.append(("Mac Absolute", dt.strftime("%Y-%m-%d %H:%M:%S UTC")))
-    except (OverflowError, ValueError):
-        pass
-    try:
-        # Chrome/WebKit (microseconds since 1601-01-01)
-        if 1e16 < v < 1.5e17:
-            epoch = datetime(1601, 1, 1, tzinfo=timezone.utc)
-            dt = epoch + timedelta(microseconds=v)
-            if 1970 <= dt.year <= 2099:
-                results.append(("Chrome/WebKit", dt.strftime("%Y-%m-%d %H:%M:%S UTC")))
-    except (OverflowError, ValueError):
-        pass
-    try:
-        # Windows FILETIME (100ns since 1601-01-01)
-        if 1e17 < v < 3e18:
-            epoch = datetime(1601, 1, 1, tzinfo=timezone.utc)
-            dt = epoch + timedelta(microseconds=v / 10)
-            if 1970 <= dt.year <= 2099:
-                results.append(("Windows FILETIME", dt.strftime("%Y-%m-%d %H:%M:%S UTC")))
-    except (OverflowError, ValueError):
-        pass
-    return results if results else None
+    results = None
+    for lo, hi, label, fn in _TS_FORMATS:
+        if lo < v < hi:
+            try:
+                text = fn(v)
+            except (OSError, OverflowError, ValueError):
+                continue
+            if text is not None:
+                if results is None:
+                    results = []
+                results.append((label, text))
+    return results
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _cached_try_decode_timestamp(val):
+    """Memoized try_decode_timestamp for repeat values across row views."""
+    r = try_decode_timestamp(val)
+    return tuple(r) if r else None
 
 
 # ── Schema formatting ────────────────────────────────────────────────────
@@ -388,15 +528,41 @@ def _build_schema_text(db, tbl, row_count=None):
     return "\n".join(lines)
 
 
-def _build_schema_html(db, filename, version, tables=None, row_counts=None):
-    """Build a full interactive HTML schema report for all tables."""
+_HTML_SPECIAL = re.compile(r"[&<>\"']").search
+
+# Column constraint badges in display order, one bit each: PK, NOT NULL,
+# UNIQUE, DEFAULT, FK. DEFAULT carries a {} slot for the escaped value.
+_BADGES = (
+    "<span class='c-pk'>PK</span>",
+    "<span class='c-nn'>NOT NULL</span>",
+    "<span class='c-uq'>UNIQUE</span>",
+    "<span class='c-def'>DEFAULT {}</span>",
+    "<span class='c-fk'>FK</span>",
+)
+# Constraints cell for every badge combination, indexed by bitmask
+_BADGE_CELLS = tuple(
+    " ".join(b for i, b in enumerate(_BADGES) if m >> i & 1) or "-"
+    for m in range(1 << len(_BADGES)))
+
+def _iter_schema_html(db, filename, version, tables=None, row_counts=None):
+    """Yield the interactive HTML schema report in chunks, for streaming to a file."""
     E = _html.escape
+    # Table/column names and types repeat across the TOC, sections and FK
+    # lists; escape each distinct one once, most need no escaping at all
+    esc = {}
+
+    def En(name):
+        r = esc.get(name)
+        if r is None:
+            r = esc[name] = E(name) if _HTML_SPECIAL(name) else name
+        return r
+
     if tables is None:
         tables = db.tables() if db.ok else []
     if row_counts is None:
         row_counts = {}
     fname = E(os.path.basename(filename) if filename else "database")
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    now = time.strftime("%Y-%m-%d %H:%M:%S")
     n_tables = len(tables)
 
     css = """
@@ -463,87 +629,78 @@ def _build_schema_html(db, filename, version, tables=None, row_counts=None):
                  nav#toc{break-inside:avoid}}
     """
 
-    # Build FK column lookup per table for badge display
-    fk_cols = {}
-    for t in tables:
-        fk_list = db.fkeys_full(t)
-        for fk in fk_list:
-            fk_cols.setdefault(t, set()).add(fk["from"])
-
-    p = []  # parts
-    p.append(f"<!DOCTYPE html>\n<html>\n<head>\n<meta charset='utf-8'>\n"
-             f"<title>Schema \u2014 {fname}</title>\n<style>{css}</style>\n</head>\n<body>\n")
+    yield (f"<!DOCTYPE html>\n<html>\n<head>\n<meta charset='utf-8'>\n"
+           f"<title>Schema \u2014 {fname}</title>\n<style>{css}</style>\n</head>\n<body>\n")
 
     # Header
-    p.append(f"<header>\n<h1>Schema: {fname}</h1>\n"
-             f"<p class='meta'>Tables: {n_tables} | Generated: {now}"
-             f" | SQLite Forensic Analyzer v{E(str(version))}</p>\n"
-             f"<div class='search-bar'>\n"
-             f"<input type='text' id='search' placeholder='Search tables, columns, constraints...' "
-             f"oninput='filterSchema()'>\n"
-             f"<button onclick='copyAllSQL()'>Copy All SQL</button>\n"
-             f"</div>\n</header>\n")
+    yield (f"<header>\n<h1>Schema: {fname}</h1>\n"
+           f"<p class='meta'>Tables: {n_tables} | Generated: {now}"
+           f" | SQLite Forensic Analyzer v{E(str(version))}</p>\n"
+           f"<div class='search-bar'>\n"
+           f"<input type='text' id='search' placeholder='Search tables, columns, constraints...' "
+           f"oninput='filterSchema()'>\n"
+           f"<button onclick='copyAllSQL()'>Copy All SQL</button>\n"
+           f"</div>\n</header>\n")
 
     # TOC
-    p.append("<nav id='toc'>\n<h3>Tables</h3>\n")
+    yield "<nav id='toc'>\n<h3>Tables</h3>\n"
     for t in tables:
         cnt = fmt_count(row_counts.get(t, "?"))
-        p.append(f"<a href='#tbl-{E(t)}' data-tbl='{E(t)}'>{E(t)} ({cnt})</a>\n")
-    p.append("</nav>\n\n<main>\n")
+        te = En(t)
+        yield f"<a href='#tbl-{te}' data-tbl='{te}'>{te} ({cnt})</a>\n"
+    yield "</nav>\n\n<main>\n"
 
     # Per-table sections
     for t in tables:
-        te = E(t)
+        te = En(t)
         cnt = fmt_count(row_counts.get(t, "?"))
+        # Query this table's metadata only when its section is due, so the
+        # export holds one table at a time; FK columns for the badges come
+        # from the same fkeys_full() result
         cols_full = db.columns_full(t)
         uniq = db.unique_columns(t)
         sql = db.create_sql(t) or ""
         idxs = db.indexes(t)
         fks = db.fkeys_full(t)
         checks = db.check_constraints(t)
-        t_fk_cols = fk_cols.get(t, set())
+        t_fk_cols = {fk["from"] for fk in fks}
+        sec = []  # this table's parts, yielded as one chunk
 
-        p.append(f"<section class='table-section' data-name='{te}'>\n"
-                 f"<h2 id='tbl-{te}'>{te} <span class='badge badge-rows'>{cnt} rows</span></h2>\n")
+        sec.append(f"<section class='table-section' data-name='{te}'>\n"
+                   f"<h2 id='tbl-{te}'>{te} <span class='badge badge-rows'>{cnt} rows</span></h2>\n")
 
         # CREATE SQL
         if sql:
-            p.append(f"<details><summary>CREATE SQL "
-                     f"<button class='copy-btn' onclick=\"copySQL('{te}')\">Copy</button>"
-                     f"</summary>\n<pre id='sql-{te}'>{E(sql)}</pre></details>\n")
+            sec.append(f"<details><summary>CREATE SQL "
+                       f"<button class='copy-btn' onclick=\"copySQL('{te}')\">Copy</button>"
+                       f"</summary>\n<pre id='sql-{te}'>{E(sql)}</pre></details>\n")
 
         # Column table
-        p.append("<table>\n<thead><tr><th>#</th><th>Column</th><th>Type</th>"
-                 "<th>Constraints</th></tr></thead>\n<tbody>\n")
+        sec.append("<table>\n<thead><tr><th>#</th><th>Column</th><th>Type</th>"
+                   "<th>Constraints</th></tr></thead>\n<tbody>\n")
         for ci, (cn, ct, notnull, default, pk) in enumerate(cols_full):
-            cne = E(cn)
-            badges = []
-            if pk:
-                badges.append("<span class='c-pk'>PK</span>")
-            if notnull:
-                badges.append("<span class='c-nn'>NOT NULL</span>")
-            if cn in uniq:
-                badges.append("<span class='c-uq'>UNIQUE</span>")
+            cne = En(cn)
+            mask = ((1 if pk else 0) | (2 if notnull else 0) | (4 if cn in uniq else 0)
+                    | (8 if default is not None else 0) | (16 if cn in t_fk_cols else 0))
+            badges = _BADGE_CELLS[mask]
             if default is not None:
-                badges.append(f"<span class='c-def'>DEFAULT {E(str(default))}</span>")
-            if cn in t_fk_cols:
-                badges.append("<span class='c-fk'>FK</span>")
+                badges = badges.format(E(str(default)))
             name_cell = f"<b>{cne}</b>" if pk else cne
-            p.append(f"<tr><td>{ci+1}</td><td>{name_cell}</td><td>{E(ct or '')}</td>"
-                     f"<td>{' '.join(badges) if badges else '-'}</td></tr>\n")
-        p.append("</tbody></table>\n")
+            sec.append(f"<tr><td>{ci+1}</td><td>{name_cell}</td><td>{En(ct or '')}</td>"
+                       f"<td>{badges}</td></tr>\n")
+        sec.append("</tbody></table>\n")
 
         # Indexes
         if idxs:
-            p.append(f"<div class='sub'><b>Indexes ({len(idxs)}):</b> ")
+            sec.append(f"<div class='sub'><b>Indexes ({len(idxs)}):</b> ")
             for name, unique, idx_cols in idxs:
                 u = " <span class='c-uq'>UNIQUE</span>" if unique else ""
-                p.append(f"<span class='idx-badge'>{E(name)}{u} ({E(', '.join(idx_cols))})</span> ")
-            p.append("</div>\n")
+                sec.append(f"<span class='idx-badge'>{En(name)}{u} ({E(', '.join(idx_cols))})</span> ")
+            sec.append("</div>\n")
 
         # Foreign keys
         if fks:
-            p.append(f"<div class='sub'><b>Foreign Keys ({len(fks)}):</b> ")
+            sec.append(f"<div class='sub'><b>Foreign Keys ({len(fks)}):</b> ")
             for fk in fks:
                 actions = []
                 if fk["on_update"]:
@@ -551,18 +708,19 @@ def _build_schema_html(db, filename, version, tables=None, row_counts=None):
                 if fk["on_delete"]:
                     actions.append(f"ON DELETE {E(fk['on_delete'])}")
                 act_str = (" <span class='c-fk'>" + " ".join(actions) + "</span>") if actions else ""
-                p.append(f"<span class='fk-badge'>{E(fk['from'])} &rarr; "
-                         f"{E(fk['table'])}({E(fk['to'])}){act_str}</span> ")
-            p.append("</div>\n")
+                sec.append(f"<span class='fk-badge'>{En(fk['from'])} &rarr; "
+                           f"{En(fk['table'])}({En(fk['to'])}){act_str}</span> ")
+            sec.append("</div>\n")
 
         # CHECK constraints
         if checks:
-            p.append(f"<div class='sub'><b>CHECK constraints ({len(checks)}):</b> ")
+            sec.append(f"<div class='sub'><b>CHECK constraints ({len(checks)}):</b> ")
             for chk in checks:
-                p.append(f"<span class='c-chk'>CHECK({E(chk)})</span> ")
-            p.append("</div>\n")
+                sec.append(f"<span class='c-chk'>CHECK({E(chk)})</span> ")
+            sec.append("</div>\n")
 
-        p.append("</section>\n\n")
+        sec.append("</section>\n\n")
+        yield "".join(sec)
 
     # Triggers section
     try:
@@ -570,16 +728,16 @@ def _build_schema_html(db, filename, version, tables=None, row_counts=None):
     except Exception:
         triggers = []
     if triggers:
-        p.append("<section class='table-section'>\n<h2>Triggers</h2>\n")
+        yield "<section class='table-section'>\n<h2>Triggers</h2>\n"
         for tname, tsql in triggers:
-            p.append(f"<details><summary>{E(tname or '')}</summary>\n"
-                     f"<pre>{E(tsql or '')}</pre></details>\n")
-        p.append("</section>\n")
+            yield (f"<details><summary>{E(tname or '')}</summary>\n"
+                   f"<pre>{E(tsql or '')}</pre></details>\n")
+        yield "</section>\n"
 
-    p.append("</main>\n")
+    yield "</main>\n"
 
     # JavaScript
-    p.append("""<script>
+    yield """<script>
 function filterSchema(){
   var q=document.getElementById('search').value.toLowerCase();
   document.querySelectorAll('.table-section').forEach(function(s){
@@ -604,7 +762,6 @@ function copySQL(id){
   var el=document.getElementById('sql-'+id);
   if(el)navigator.clipboard.writeText(el.textContent).then(function(){alert('Copied!')});
 }
-</script>\n""")
+</script>\n"""
 
-    p.append("</body>\n</html>")
-    return "".join(p)
+    yield "</body>\n</html>"
@@ -18,7 +18,9 @@ import mmap
 import os
 import re
 import struct
-from collections import namedtuple
+import sys
+from array import array
+from collections import Counter, namedtuple
 
 from constants import (WAL_MAGIC_BE, WAL_MAGIC_LE, WAL_HEADER_SIZE,
                        WAL_FRAME_HEADER_SIZE, PAGE_TYPES)
@@ -31,26 +33,93 @@ WALHeader = namedtuple("WALHeader", [
     "salt1", "salt2", "checksum1", "checksum2",
 ])
 
-WALFrame = namedtuple("WALFrame", [
-    "index",          # 0-based frame index
-    "offset",         # byte offset of frame header in WAL file
-    "page_num",       # database page number this frame overwrites
-    "commit_size",    # >0 on last frame of a committed transaction
-    "salt1", "salt2", # frame salt values
-    "checksum1", "checksum2",
-    "category",       # 'committed' | 'uncommitted' | 'old'
-    "page_type",      # human-readable page type string
-    "page_type_byte", # raw first byte of page data
-])
+class WALFrame:
+    """One WAL frame header plus its classification.
+
+    A __slots__ class rather than a namedtuple: attribute reads are direct
+    slot lookups and each frame is smaller.  Field order is kept, and
+    iterating a frame yields its fields like the old tuple did.
+    ``page_type`` is looked up from ``page_type_byte`` on access.
+    """
+
+    __slots__ = (
+        "index",          # 0-based frame index
+        "offset",         # byte offset of frame header in WAL file
+        "page_num",       # database page number this frame overwrites
+        "commit_size",    # >0 on last frame of a committed transaction
+        "salt1", "salt2", # frame salt values
+        "checksum1", "checksum2",
+        "category",       # 'committed' | 'uncommitted' | 'old'
+        "page_type_byte", # raw first byte of page data
+    )
+    _fields = ("index", "offset", "page_num", "commit_size", "salt1", "salt2",
+               "checksum1", "checksum2", "category", "page_type", "page_type_byte")
+
+    def __init__(self, index, offset, page_num, commit_size, salt1, salt2,
+                 checksum1, checksum2, category, page_type_byte):
+        self.index = index
+        self.offset = offset
+        self.page_num = page_num
+        self.commit_size = commit_size
+        self.salt1 = salt1
+        self.salt2 = salt2
+        self.checksum1 = checksum1
+        self.checksum2 = checksum2
+        self.category = category
+        self.page_type_byte = page_type_byte
+
+    @property
+    def page_type(self):
+        """Human-readable page type string."""
+        return _PAGE_TYPE_LABELS[self.page_type_byte]
+
+    def __iter__(self):
+        return iter((self.index, self.offset, self.page_num, self.commit_size,
+                     self.salt1, self.salt2, self.checksum1, self.checksum2,
+                     self.category, self.page_type, self.page_type_byte))
+
+    def __eq__(self, other):
+        if not isinstance(other, WALFrame):
+            return NotImplemented
+        return tuple(self) == tuple(other)
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        return "WALFrame({})".format(
+            ", ".join(f"{k}={getattr(self, k)!r}" for k in self._fields))
+
+
+# WAL header after the magic (version, page_size, checkpoint_seq, salt1,
+# salt2, checksum1, checksum2) and frame header, keyed by big-endianness
+_HDR_STRUCTS = {True: struct.Struct(">7I"), False: struct.Struct("<7I")}
+_FRAME_STRUCTS = {True: struct.Struct(">6I"), False: struct.Struct("<6I")}
 
 
 # ── Varint / serial type helpers ─────────────────────────────────────────
 
+_BE_DOUBLE = struct.Struct(">d")
+
 def _read_varint(data, offset):
     """Read a SQLite varint (1-9 bytes, MSB continuation bit).
 
     Returns (value, new_offset).  Raises ValueError on truncated data.
     """
+    # Fast paths: serial types, header sizes, payload lengths under 16 KiB
+    # and small rowids are one- or two-byte varints
+    n = len(data)
+    if offset + 1 < n:
+        b = data[offset]
+        if b < 0x80:
+            return (b, offset + 1)
+        b2 = data[offset + 1]
+        if b2 < 0x80:
+            return (((b & 0x7F) << 7) | b2, offset + 2)
+    elif offset < n:
+        b = data[offset]
+        if b < 0x80:
+            return (b, offset + 1)
     result = 0
     for i in range(9):
         if offset >= len(data):
@@ -68,33 +137,35 @@ def _read_varint(data, offset):
     return (result, offset)
 
 
+# Payload size and fixed value (NULL / 0 / 1) for serial types 0-11;
+# 1-6 are big-endian ints, 7 is a float, 10 and 11 are reserved
+_SERIAL_SIZE = (0, 1, 2, 3, 4, 6, 8, 8, 0, 0, 0, 0)
+_SERIAL_CONST = (None, None, None, None, None, None, None, None, 0, 1, None, None)
+
+
 def _serial_type_size(st):
     """Return the byte-length of a value with the given serial type code."""
-    if st == 0:
-        return 0      # NULL
-    if st == 1:
-        return 1      # 8-bit int
-    if st == 2:
-        return 2      # 16-bit int
-    if st == 3:
-        return 3      # 24-bit int
-    if st == 4:
-        return 4      # 32-bit int
-    if st == 5:
-        return 6      # 48-bit int
-    if st == 6:
-        return 8      # 64-bit int
-    if st == 7:
-        return 8      # IEEE 754 float
-    if st == 8:
-        return 0      # integer 0
-    if st == 9:
-        return 0      # integer 1
-    if st >= 12 and st % 2 == 0:
-        return (st - 12) // 2   # BLOB
-    if st >= 13 and st % 2 == 1:
-        return (st - 13) // 2   # TEXT
-    return 0
+    if st >= 12:
+        return (st - 12) >> 1   # BLOB (even) / TEXT (odd)
+    return _SERIAL_SIZE[st]
+
+
+def _sv_int(data, offset, sz):
+    # Signed big-endian integer
+    return (int.from_bytes(data[offset:offset + sz], "big", signed=True), offset + sz)
+
+
+def _sv_float(data, offset, sz):
+    return (_BE_DOUBLE.unpack_from(data, offset)[0], offset + sz)
+
+
+def _sv_reserved(data, offset, sz):
+    return (None, offset)
+
+
+# Decoder per sized serial type 1-7, 10, 11 (0, 8, 9 come from _SERIAL_CONST)
+_SERIAL_DECODERS = (None, _sv_int, _sv_int, _sv_int, _sv_int, _sv_int, _sv_int,
+                    _sv_float, None, None, _sv_reserved, _sv_reserved)
 
 
 def _read_serial_value(data, offset, serial_type):
@@ -102,41 +173,23 @@ def _read_serial_value(data, offset, serial_type):
 
     Returns (value, new_offset).
     """
-    if serial_type == 0:
-        return (None, offset)
-    if serial_type == 8:
-        return (0, offset)
-    if serial_type == 9:
-        return (1, offset)
-
-    sz = _serial_type_size(serial_type)
+    if serial_type < 12:
+        if serial_type in (0, 8, 9):
+            return (_SERIAL_CONST[serial_type], offset)
+        sz = _SERIAL_SIZE[serial_type]
+        if offset + sz > len(data):
+            raise ValueError(f"Truncated value: need {sz} bytes at offset {offset}")
+        return _SERIAL_DECODERS[serial_type](data, offset, sz)
+
+    sz = (serial_type - 12) >> 1
     if offset + sz > len(data):
         raise ValueError(f"Truncated value: need {sz} bytes at offset {offset}")
-
     chunk = data[offset:offset + sz]
-
-    if serial_type in (1, 2, 3, 4, 5, 6):
-        # Signed big-endian integer
-        val = int.from_bytes(chunk, "big", signed=True)
-        return (val, offset + sz)
-
-    if serial_type == 7:
-        val = struct.unpack(">d", chunk)[0]
-        return (val, offset + sz)
-
-    if serial_type >= 12 and serial_type % 2 == 0:
-        # BLOB
-        return (bytes(chunk), offset + sz)
-
-    if serial_type >= 13 and serial_type % 2 == 1:
+    if serial_type & 1:
         # TEXT (UTF-8)
-        try:
-            val = bytes(chunk).decode("utf-8", errors="replace")
-        except Exception:
-            val = bytes(chunk).decode("latin-1", errors="replace")
-        return (val, offset + sz)
-
-    return (None, offset + sz)
+        return (str(chunk, "utf-8", "replace"), offset + sz)
+    # BLOB
+    return (bytes(chunk), offset + sz)
 
 
 def _parse_record(data, offset):
@@ -145,37 +198,148 @@ def _parse_record(data, offset):
     A record is: header_length (varint), serial_type1 (varint), ...,
     followed by the values.
 
-    Returns list of decoded values.
+    Returns list of decoded values.  Decoding is inlined here (same rules
+    as _read_serial_value) since this runs for every cell in the WAL.
     """
     start = offset
+    n = len(data)
     header_len, offset = _read_varint(data, offset)
     header_end = start + header_len
 
-    # Read serial types
+    # Read serial types — almost always single-byte varints
     serial_types = []
     while offset < header_end:
-        st, offset = _read_varint(data, offset)
-        serial_types.append(st)
+        if offset < n and data[offset] < 0x80:
+            serial_types.append(data[offset])
+            offset += 1
+        else:
+            st, offset = _read_varint(data, offset)
+            serial_types.append(st)
 
     # Ensure we're at header_end
     offset = header_end
 
     # Read values
     values = []
+    append = values.append
     for st in serial_types:
-        val, offset = _read_serial_value(data, offset, st)
-        values.append(val)
+        if st >= 12:
+            # BLOB (even) / TEXT (odd)
+            sz = (st - 12) >> 1
+            end = offset + sz
+            if end > n:
+                raise ValueError(f"Truncated value: need {sz} bytes at offset {offset}")
+            if st & 1:
+                append(str(data[offset:end], "utf-8", "replace"))
+            else:
+                append(bytes(data[offset:end]))
+            offset = end
+        else:
+            sz = _SERIAL_SIZE[st]
+            if not sz:
+                append(_SERIAL_CONST[st])   # NULL, 0, 1, reserved
+                continue
+            end = offset + sz
+            if end > n:
+                raise ValueError(f"Truncated value: need {sz} bytes at offset {offset}")
+            if st == 7:
+                append(_BE_DOUBLE.unpack_from(data, offset)[0])
+            else:
+                # Signed big-endian integer
+                append(int.from_bytes(data[offset:end], "big", signed=True))
+            offset = end
 
     return values
 
 
-def _identify_page_type(page_data):
-    """Return (page_type_byte, human_label) for a page."""
-    if not page_data or len(page_data) < 1:
-        return (0, "Unknown")
-    pt = page_data[0]
-    label = PAGE_TYPES.get(pt, f"Unknown (0x{pt:02X})")
-    return (pt, label)
+# Label for every possible page-type byte (WALFrame.page_type, summary)
+_PAGE_TYPE_LABELS = tuple(PAGE_TYPES.get(pt, f"Unknown (0x{pt:02X})") for pt in range(256))
+
+# Search-result "source" label per frame category
+_CAT_SOURCE = {
+    "committed": "WAL (Saved)",
+    "uncommitted": "WAL (Unsaved)",
+    "old": "WAL (Overwritten)",
+}
+
+# Leaf frames to read ahead of the one being parsed (madvise, where available)
+PREFETCH_AHEAD = 8
+_HAS_MADVISE = hasattr(mmap.mmap, "madvise") and hasattr(mmap, "MADV_WILLNEED")
+
+# Cell pointers are big-endian u16; array("H") reads native order
+_SWAP_U16 = sys.byteorder == "little"
+# array typecode for the u32 frame-header columns
+_U32 = "I" if array("I").itemsize == 4 else "L"
+
+
+def _cell_pointers(page_data, ptr_start, cell_count):
+    """Decode a b-tree cell pointer array (big-endian u16) into a list.
+
+    Stops at the end of the page if cell_count overruns it.
+    """
+    count = min(cell_count, (len(page_data) - ptr_start) // 2)
+    if count <= 0:
+        return []
+    ptrs = array("H")
+    ptrs.frombytes(page_data[ptr_start:ptr_start + 2 * count])
+    if _SWAP_U16:
+        ptrs.byteswap()
+    return ptrs.tolist()
+
+
+def _parse_leaf_cells(page_data, hdr_off):
+    """Parse the cells of a table leaf page whose b-tree header is at hdr_off.
+
+    Reads the cell count and pointer array straight from the header in one
+    pass (no parse_btree_page dict).  Corrupt cells are skipped.
+    """
+    n = len(page_data)
+    cell_count = int.from_bytes(page_data[hdr_off + 3:hdr_off + 5], "big")
+    # Cell pointer array follows the 8-byte leaf header; pointers past the
+    # end of the page (torn or garbage pages) are dropped before decoding
+    cell_offsets = [co for co in _cell_pointers(page_data, hdr_off + 8, cell_count)
+                    if co < n]
+    cells = []
+    for cell_offset in cell_offsets:
+        try:
+            # payload_len, rowid (varints — usually one or two bytes)
+            payload_len, off = _read_varint(page_data, cell_offset)
+            rowid, off = _read_varint(page_data, off)
+
+            # If the payload spills to overflow pages only the local part
+            # is on this page — parse what's available
+            payload_end = min(off + payload_len, n)
+            if payload_end <= off:
+                continue
+
+            values = _parse_record(page_data[off:payload_end], 0)
+            cells.append({"rowid": rowid, "values": values})
+        except Exception:
+            # Skip corrupt/unparseable cells
+            continue
+    return cells
+
+
+def _row_display_values(values, col_names, pk_idx, rowid):
+    """Return {column: display string} for a recovered row — full values,
+    no truncation.  BLOBs are summarised as size + detected type."""
+    row = {}
+    for vi, v in enumerate(values):
+        cname = col_names[vi] if vi < len(col_names) else f"col{vi}"
+        # INTEGER PRIMARY KEY: SQLite stores rowid separately,
+        # the record payload has NULL — substitute the real rowid
+        if vi == pk_idx and v is None:
+            row[cname] = str(rowid)
+        elif v is None:
+            row[cname] = "NULL"
+        elif isinstance(v, bytes):
+            from utils import blob_type as _bt, fmtb as _fb
+            row[cname] = f"[BLOB: {_fb(len(v))}, {_bt(v)}]"
+        elif isinstance(v, float):
+            row[cname] = f"{v:.6g}"
+        else:
+            row[cname] = str(v)
+    return row
 
 
 # ── WALParser class ──────────────────────────────────────────────────────
@@ -187,8 +351,19 @@ class WALParser:
         self._path = None
         self._f = None
         self._mm = None
+        self._mv = None   # memoryview over _mm, sliced by _page_view
         self.header = None
         self.frames = []
+        # Per-frame columns parallel to ``frames`` for scans that only need
+        # one or two fields: page-type bytes (bytes), page numbers, categories,
+        # and u32 arrays of commit sizes and salts
+        self.page_type_bytes = b""
+        self.page_nums = []
+        self.categories = []
+        self.commit_sizes = array(_U32)
+        self.salt1s = array(_U32)
+        self.salt2s = array(_U32)
+        self._leaf_idx = []   # indices of table leaf (0x0D) frames
         self.page_size = 0
         self._valid = False
         self._file_size = 0
@@ -196,6 +371,11 @@ class WALParser:
         self.page_map = {}   # page_num → table_name
         self.col_map = {}    # table_name → [col_name, ...]
         self.pk_col_idx = {} # table_name → column index of INTEGER PRIMARY KEY
+        # page_map resolved per frame (table name or None), see rebuild_lookup
+        self.frame_tables = []
+        self._lookup_src = None
+        # (frames list, frame count, groups) from the last transaction_groups()
+        self._groups_cache = None
 
     # ── open / close ─────────────────────────────────────────────────
 
@@ -238,6 +418,12 @@ class WALParser:
 
     def close(self):
         """Release resources."""
+        if self._mv is not None:
+            try:
+                self._mv.release()
+            except Exception:
+                pass
+            self._mv = None
         if self._mm:
             try:
                 self._mm.close()
@@ -253,6 +439,16 @@ class WALParser:
         self._path = None
         self.header = None
         self.frames = []
+        self.page_type_bytes = b""
+        self.page_nums = []
+        self.categories = []
+        self.commit_sizes = array(_U32)
+        self.salt1s = array(_U32)
+        self.salt2s = array(_U32)
+        self._leaf_idx = []
+        self.frame_tables = []
+        self._lookup_src = None
+        self._groups_cache = None
         self.page_size = 0
         self._valid = False
         self._file_size = 0
@@ -273,17 +469,21 @@ class WALParser:
         if len(mm) < WAL_HEADER_SIZE:
             return
 
-        magic = struct.unpack(">I", mm[0:4])[0]
+        magic = int.from_bytes(mm[0:4], "big")
         if magic not in (WAL_MAGIC_BE, WAL_MAGIC_LE):
             return
 
         # Determine byte order from magic number
         self._big_endian = (magic == WAL_MAGIC_BE)
-        bo = ">" if self._big_endian else "<"
 
-        version, page_size, ckpt_seq = struct.unpack(f"{bo}III", mm[4:16])
-        salt1, salt2 = struct.unpack(f"{bo}II", mm[16:24])
-        cksum1, cksum2 = struct.unpack(f"{bo}II", mm[24:32])
+        (version, page_size, ckpt_seq, salt1, salt2,
+         cksum1, cksum2) = _HDR_STRUCTS[self._big_endian].unpack_from(mm, 4)
+
+        # SQLite page sizes are powers of two from 512 to 65536; anything
+        # else is a damaged header, and the frame stride derived from it
+        # would be meaningless
+        if not (512 <= page_size <= 65536 and page_size & (page_size - 1) == 0):
+            return
 
         self.header = WALHeader(
             magic=magic, version=version, page_size=page_size,
@@ -291,6 +491,7 @@ class WALParser:
             checksum1=cksum1, checksum2=cksum2,
         )
         self.page_size = page_size
+        self._mv = memoryview(mm)
         self._valid = True
 
     # ── frame parsing ────────────────────────────────────────────────
@@ -300,54 +501,126 @@ class WALParser:
 
         Only reads the 24-byte frame headers (not full page data) — fast.
         Page data is read lazily via get_page_data().
+
+        Frame headers sit at a fixed stride, so each of the 24 header byte
+        columns and the page-type byte column is gathered with one strided
+        memoryview slice, and the packed headers decode in a single
+        struct.iter_unpack pass.
         """
         mm = self._mm
-        ps = self.page_size
-        frame_total_size = WAL_FRAME_HEADER_SIZE + ps
-        offset = WAL_HEADER_SIZE
-        bo = ">" if self._big_endian else "<"
+        frame_total_size = WAL_FRAME_HEADER_SIZE + self.page_size
+        n = (len(mm) - WAL_HEADER_SIZE) // frame_total_size
+        if n <= 0:
+            return
+        end = WAL_HEADER_SIZE + n * frame_total_size
+        hdrs = bytearray(n * WAL_FRAME_HEADER_SIZE)
+        with memoryview(mm) as mv:
+            for j in range(WAL_FRAME_HEADER_SIZE):
+                hdrs[j::WAL_FRAME_HEADER_SIZE] = \
+                    mv[WAL_HEADER_SIZE + j:end:frame_total_size].tobytes()
+            pt_bytes = mv[WAL_HEADER_SIZE + WAL_FRAME_HEADER_SIZE:end:frame_total_size].tobytes()
+
+        # The same headers as u32 columns: page_num, commit_size, salt1,
+        # salt2, checksum1, checksum2 — one array, sliced by stride
+        cols = array(_U32)
+        cols.frombytes(hdrs)
+        if self._big_endian == (sys.byteorder == "little"):
+            cols.byteswap()
+
         hdr_salt1 = self.header.salt1
         hdr_salt2 = self.header.salt2
-        idx = 0
         frames = []
-
-        while offset + frame_total_size <= len(mm):
-            # Parse 24-byte frame header
-            page_num, commit_size, f_salt1, f_salt2, cksum1, cksum2 = \
-                struct.unpack(f"{bo}IIIIII", mm[offset:offset + WAL_FRAME_HEADER_SIZE])
-
+        categories = []
+        offset = WAL_HEADER_SIZE
+        for idx, (page_num, commit_size, f_salt1, f_salt2, cksum1, cksum2) in \
+                enumerate(_FRAME_STRUCTS[self._big_endian].iter_unpack(hdrs)):
             # Classify
-            salt_match = (f_salt1 == hdr_salt1 and f_salt2 == hdr_salt2)
-            if salt_match and commit_size > 0:
-                category = "committed"
-            elif salt_match:
-                category = "uncommitted"
+            if f_salt1 == hdr_salt1 and f_salt2 == hdr_salt2:
+                category = "committed" if commit_size > 0 else "uncommitted"
             else:
                 category = "old"
-
-            # Identify page type from first byte of page data
-            page_data_offset = offset + WAL_FRAME_HEADER_SIZE
-            pt_byte, pt_label = _identify_page_type(mm[page_data_offset:page_data_offset + 1])
-
-            frames.append(WALFrame(
-                index=idx, offset=offset, page_num=page_num,
-                commit_size=commit_size, salt1=f_salt1, salt2=f_salt2,
-                checksum1=cksum1, checksum2=cksum2,
-                category=category, page_type=pt_label,
-                page_type_byte=pt_byte,
-            ))
-
+            pt_byte = pt_bytes[idx]
+            frames.append(WALFrame(idx, offset, page_num, commit_size,
+                                   f_salt1, f_salt2, cksum1, cksum2,
+                                   category, pt_byte))
+            categories.append(category)
             offset += frame_total_size
-            idx += 1
 
         self.frames = frames
+        self.page_type_bytes = pt_bytes
+        self.page_nums = cols[0::6].tolist()
+        self.categories = categories
+        self.commit_sizes = cols[1::6]
+        self.salt1s = cols[2::6]
+        self.salt2s = cols[3::6]
+        # Only table leaf pages carry row data — search, recovery and
+        # table_stats iterate just these
+        self._leaf_idx = list(self._frame_indices(0x0D))
+
+    def _frame_indices(self, page_type_byte):
+        """Yield indices of frames whose page has the given type byte.
+
+        Scans the packed page-type column with bytes.find, so frames of
+        other types are skipped without touching their WALFrame.
+        """
+        col = self.page_type_bytes
+        i = col.find(page_type_byte)
+        while i != -1:
+            yield i
+            i = col.find(page_type_byte, i + 1)
+
+    def _prefetch_frame(self, frame_index):
+        """Ask the kernel to start reading a frame's page data (no-op if
+        madvise is unavailable).  Lets page-fault latency for upcoming
+        leaf frames overlap with parsing the current one."""
+        if not _HAS_MADVISE:
+            return
+        start = (WAL_HEADER_SIZE + frame_index * (WAL_FRAME_HEADER_SIZE + self.page_size)
+                 + WAL_FRAME_HEADER_SIZE)
+        aligned = start - start % mmap.PAGESIZE
+        try:
+            self._mm.madvise(mmap.MADV_WILLNEED, aligned, start + self.page_size - aligned)
+        except Exception:
+            pass
+
+    def _iter_prefetched(self, frame_indices):
+        """Yield frame_indices in order, hinting each frame's page
+        PREFETCH_AHEAD positions before it is reached."""
+        for fi in frame_indices[:PREFETCH_AHEAD]:
+            self._prefetch_frame(fi)
+        n = len(frame_indices)
+        for k, fi in enumerate(frame_indices):
+            if k + PREFETCH_AHEAD < n:
+                self._prefetch_frame(frame_indices[k + PREFETCH_AHEAD])
+            yield fi
+
+    def rebuild_lookup(self):
+        """Resolve page_map into the per-frame ``frame_tables`` column.
+
+        Called by DB._build_wal_page_map() after it sets page_map, so the
+        scans index a list by frame instead of hashing every page number.
+        """
+        page_map = self.page_map
+        self.frame_tables = list(map(page_map.get, self.page_nums))
+        self._lookup_src = page_map
+
+    def _tables(self):
+        """Return ``frame_tables``, rebuilding it if page_map was replaced."""
+        if self._lookup_src is not self.page_map:
+            self.rebuild_lookup()
+        return self.frame_tables
 
     # ── page data access ─────────────────────────────────────────────
 
     def get_page_data(self, frame_index):
-        """Return raw page bytes for the given frame index.
+        """Return raw page bytes for the given frame index."""
+        return bytes(self._page_view(frame_index))
 
-        Uses memoryview slice of the mmap — zero-copy.
+    def _page_view(self, frame_index):
+        """Return a zero-copy memoryview slice of the frame's page.
+
+        For the internal scans only: the view pins the mmap, so close()
+        cannot unmap it while one is alive — never keep it past one page.
         """
         if not self._valid or frame_index < 0 or frame_index >= len(self.frames):
             return b""
@@ -356,7 +629,7 @@ class WALParser:
         end = start + self.page_size
         if end > len(self._mm):
             return b""
-        return bytes(self._mm[start:end])
+        return self._mv[start:end]
 
     # ── b-tree page parsing ──────────────────────────────────────────
 
@@ -390,13 +663,7 @@ class WALParser:
             right_child = int.from_bytes(page_data[8:12], "big")
 
         # Cell pointer array follows header
-        ptr_start = hdr_size
-        cell_offsets = []
-        for i in range(cell_count):
-            po = ptr_start + i * 2
-            if po + 2 > len(page_data):
-                break
-            cell_offsets.append(int.from_bytes(page_data[po:po + 2], "big"))
+        cell_offsets = _cell_pointers(page_data, hdr_size, cell_count)
 
         return {
             "page_type": PAGE_TYPES.get(pt, f"Unknown (0x{pt:02X})"),
@@ -419,40 +686,7 @@ class WALParser:
             return []
         if page_data[0] != 0x0D:
             return []
-
-        info = self.parse_btree_page(page_data)
-        if not info:
-            return []
-
-        cells = []
-        for cell_offset in info["cell_offsets"]:
-            try:
-                if cell_offset >= len(page_data):
-                    continue
-                off = cell_offset
-                # payload_len (varint)
-                payload_len, off = _read_varint(page_data, off)
-                # rowid (varint)
-                rowid, off = _read_varint(page_data, off)
-
-                # Check for overflow: if payload fits on this page, parse inline
-                # Usable size = page_size - reserved (usually 0)
-                # Max local payload for table leaf: usable - 35
-                # If payload > max local, only part is inline, rest is overflow
-                # For simplicity, parse what's available on this page
-                payload_start = off
-                payload_end = min(payload_start + payload_len, len(page_data))
-                if payload_end <= payload_start:
-                    continue
-
-                payload = page_data[payload_start:payload_end]
-                values = _parse_record(payload, 0)
-                cells.append({"rowid": rowid, "values": values})
-            except Exception:
-                # Skip corrupt/unparseable cells
-                continue
-
-        return cells
+        return _parse_leaf_cells(page_data, 0)
 
     def parse_page1_cells(self, page_data):
         """Parse cells from page 1 which has a 100-byte DB header prefix.
@@ -467,35 +701,7 @@ class WALParser:
         pt = page_data[100]
         if pt != 0x0D:  # Must be table leaf
             return []
-
-        # Parse header at offset 100
-        cell_count = int.from_bytes(page_data[103:105], "big")
-        # Cell pointer array starts at offset 108 (100 + 8 byte leaf header)
-        cell_offsets = []
-        for i in range(cell_count):
-            po = 108 + i * 2
-            if po + 2 > len(page_data):
-                break
-            cell_offsets.append(int.from_bytes(page_data[po:po + 2], "big"))
-
-        cells = []
-        for cell_offset in cell_offsets:
-            try:
-                if cell_offset >= len(page_data):
-                    continue
-                off = cell_offset
-                payload_len, off = _read_varint(page_data, off)
-                rowid, off = _read_varint(page_data, off)
-                payload_start = off
-                payload_end = min(payload_start + payload_len, len(page_data))
-                if payload_end <= payload_start:
-                    continue
-                payload = page_data[payload_start:payload_end]
-                values = _parse_record(payload, 0)
-                cells.append({"rowid": rowid, "values": values})
-            except Exception:
-                continue
-        return cells
+        return _parse_leaf_cells(page_data, 100)
 
     # ── search ───────────────────────────────────────────────────────
 
@@ -520,30 +726,73 @@ class WALParser:
                 return
 
         term_lower = term.lower()
+        # Compiled matcher for the case-insensitive modes: for ASCII values
+        # (the bulk of WAL text) ASCII IGNORECASE is exactly lower()-then-
+        # compare, without copying the value; non-ASCII values keep lower()
+        ci_rx = None
+        if mode != "Regex" and term.isascii():
+            ci_rx = re.compile(re.escape(term), re.IGNORECASE | re.ASCII)
+        term_len = len(term)
+
+        # Pick the matcher for this mode once, outside the value loop
+        if mode == "Case-Sensitive":
+            def match(s):
+                return term in s
+        elif mode == "Exact Match":
+            def match(s):
+                return s == term
+        elif mode == "Regex":
+            match = rx.search
+        elif mode == "Starts With":
+            def match(s):
+                if ci_rx is not None and s.isascii():
+                    return ci_rx.match(s) is not None
+                return s.lower().startswith(term_lower)
+        elif mode == "Ends With":
+            def match(s):
+                if ci_rx is not None and s.isascii():
+                    return (len(s) >= term_len and
+                            ci_rx.fullmatch(s, len(s) - term_len) is not None)
+                return s.lower().endswith(term_lower)
+        elif ci_rx is not None:
+            # Case-Insensitive (also the default)
+            ci_search = ci_rx.search
+
+            def match(s):
+                if s.isascii():
+                    return ci_search(s) is not None
+                return term_lower in s.lower()
+        else:
+            def match(s):
+                return term_lower in s.lower()
+
         found = 0
 
-        for frame in self.frames:
+        page_nums = self.page_nums
+        categories = self.categories
+        frame_tables = self._tables()
+        # Only table leaf pages contain row data
+        for fi in self._iter_prefetched(self._leaf_idx):
             if cancel and cancel():
                 return
             if found >= limit:
                 return
 
-            # Only table leaf pages contain row data
-            if frame.page_type_byte != 0x0D:
-                continue
+            page_num = page_nums[fi]
             # Skip sqlite_master / schema pages
-            if frame.page_num == 1:
+            if page_num == 1:
                 continue
 
             try:
-                page_data = self.get_page_data(frame.index)
-                cells = self.parse_leaf_cells(page_data)
+                # No name holds the view, so it is gone before any yield
+                cells = self.parse_leaf_cells(self._page_view(fi))
             except Exception:
                 continue
 
             # Resolve table name and column names from page map
-            table_name = self.page_map.get(frame.page_num,
-                                            f"page_{frame.page_num}")
+            table_name = frame_tables[fi] or f"page_{page_num}"
+            category = categories[fi]
+            source = _CAT_SOURCE.get(category) or f"WAL ({category})"
             # Skip system tables
             if table_name in ("sqlite_master", "sqlite_sequence"):
                 continue
@@ -558,24 +807,8 @@ class WALParser:
                     return
 
                 rowid = cell["rowid"]
-
-                # Build complete row dict — FULL values, no truncation
-                row_values = {}
-                for vi, v in enumerate(cell["values"]):
-                    cname = col_names[vi] if vi < len(col_names) else f"col{vi}"
-                    # INTEGER PRIMARY KEY: SQLite stores rowid separately,
-                    # the record payload has NULL — substitute the real rowid
-                    if vi == pk_idx and v is None:
-                        row_values[cname] = str(rowid)
-                    elif v is None:
-                        row_values[cname] = "NULL"
-                    elif isinstance(v, bytes):
-                        from utils import blob_type as _bt, fmtb as _fb
-                        row_values[cname] = f"[BLOB: {_fb(len(v))}, {_bt(v)}]"
-                    elif isinstance(v, float):
-                        row_values[cname] = f"{v:.6g}"
-                    else:
-                        row_values[cname] = str(v)  # Full value, no truncation
+                # Complete row dict, built on the cell's first match only
+                row_values = None
 
                 for ci, val in enumerate(cell["values"]):
                     # For PK column, treat as rowid value for matching
@@ -588,26 +821,11 @@ class WALParser:
                         continue
 
                     s = str(val)
-                    matched = False
-
-                    if mode == "Case-Insensitive":
-                        matched = term_lower in s.lower()
-                    elif mode == "Case-Sensitive":
-                        matched = term in s
-                    elif mode == "Exact Match":
-                        matched = s == term
-                    elif mode == "Starts With":
-                        matched = s.lower().startswith(term_lower)
-                    elif mode == "Ends With":
-                        matched = s.lower().endswith(term_lower)
-                    elif mode == "Regex":
-                        matched = bool(rx.search(s))
-                    else:
-                        # Default: case-insensitive
-                        matched = term_lower in s.lower()
-
-                    if matched:
+                    if match(s):
                         found += 1
+                        if row_values is None:
+                            row_values = _row_display_values(
+                                cell["values"], col_names, pk_idx, rowid)
                         # Truncate for search result display only
                         display_val = s if len(s) <= 500 else s[:500] + "..."
                         dt = "text" if isinstance(val, str) else \
@@ -621,14 +839,10 @@ class WALParser:
                             "rowid": rowid,
                             "value": display_val,
                             "type": dt,
-                            "source": "WAL ({})".format(
-                                {"committed": "Saved",
-                                 "uncommitted": "Unsaved",
-                                 "old": "Overwritten"}.get(
-                                    frame.category, frame.category)),
-                            "frame_idx": frame.index,
-                            "page_num": frame.page_num,
-                            "category": frame.category,
+                            "source": source,
+                            "frame_idx": fi,
+                            "page_num": page_num,
+                            "category": category,
                             "row_data": row_values,
                         }
                         if found >= limit:
@@ -666,29 +880,40 @@ class WALParser:
         if not self._valid:
             return
 
-        for frame in self.frames:
-            if cancel and cancel():
-                return
-            if frame.page_type_byte != 0x0D:
-                continue
-            if category_filter and frame.category != category_filter:
-                continue
+        page_nums = self.page_nums
+        categories = self.categories
+        frame_tables = self._tables()
 
-            table_name = self.page_map.get(frame.page_num,
-                                           f"page_{frame.page_num}")
+        # Resolve the frames to decode up front from the per-frame columns,
+        # so a filtered recovery can read ahead just the (often sparse)
+        # frames it will actually parse
+        targets = []
+        for fi in self._leaf_idx:
+            if category_filter and categories[fi] != category_filter:
+                continue
+            page_num = page_nums[fi]
+            table_name = frame_tables[fi] or f"page_{page_num}"
 
             # Skip system tables / schema pages unless explicitly requested
             if not include_schema:
                 if (table_name in ("sqlite_master", "sqlite_sequence")
-                        or frame.page_num == 1):
+                        or page_num == 1):
                     continue
 
             if table_filter and table_name != table_filter:
                 continue
+            targets.append(fi)
+
+        for fi in self._iter_prefetched(targets):
+            if cancel and cancel():
+                return
+            category = categories[fi]
+            page_num = page_nums[fi]
+            table_name = frame_tables[fi] or f"page_{page_num}"
 
             try:
-                page_data = self.get_page_data(frame.index)
-                cells = self.parse_leaf_cells(page_data)
+                # No name holds the view, so it is gone before any yield
+                cells = self.parse_leaf_cells(self._page_view(fi))
             except Exception:
                 continue
 
@@ -714,30 +939,17 @@ class WALParser:
                 if cancel and cancel():
                     return
                 rowid = cell["rowid"]
-                values_dict = {}
-                for vi, v in enumerate(cell["values"]):
-                    cname = (col_names[vi] if vi < len(col_names)
-                             else f"col{vi}")
-                    if vi == pk_idx and v is None:
-                        values_dict[cname] = str(rowid)
-                    elif v is None:
-                        values_dict[cname] = "NULL"
-                    elif isinstance(v, bytes):
-                        from utils import blob_type as _bt, fmtb as _fb
-                        values_dict[cname] = f"[BLOB: {_fb(len(v))}, {_bt(v)}]"
-                    elif isinstance(v, float):
-                        values_dict[cname] = f"{v:.6g}"
-                    else:
-                        values_dict[cname] = str(v)
+                values_dict = _row_display_values(cell["values"], col_names,
+                                                  pk_idx, rowid)
 
                 yield {
                     "table": table_name,
                     "rowid": rowid,
                     "values_dict": values_dict,
                     "raw_values": cell["values"],
-                    "frame_idx": frame.index,
-                    "page_num": frame.page_num,
-                    "category": frame.category,
+                    "frame_idx": fi,
+                    "page_num": page_num,
+                    "category": category,
                 }
 
     # ── summary / analytics ──────────────────────────────────────────
@@ -747,21 +959,17 @@ class WALParser:
         if not self._valid:
             return {}
 
-        cats = {"committed": 0, "uncommitted": 0, "old": 0}
-        page_types = {}
-        unique_pages = set()
-
-        for f in self.frames:
-            cats[f.category] = cats.get(f.category, 0) + 1
-            page_types[f.page_type] = page_types.get(f.page_type, 0) + 1
-            unique_pages.add(f.page_num)
+        # Counted straight off the per-frame columns, in first-seen order
+        cats = Counter(self.categories)
+        page_types = {_PAGE_TYPE_LABELS[pt]: n
+                      for pt, n in Counter(self.page_type_bytes).items()}
 
         return {
             "total_frames": len(self.frames),
             "committed": cats["committed"],
             "uncommitted": cats["uncommitted"],
             "old": cats["old"],
-            "unique_pages": len(unique_pages),
+            "unique_pages": len(set(self.page_nums)),
             "page_types": page_types,
             "wal_size": self._file_size,
             "page_size": self.page_size,
@@ -785,16 +993,29 @@ class WALParser:
             return {}
 
         stats = {}
-        for frame in self.frames:
-            if frame.page_type_byte != 0x0D:
-                continue
-            table_name = self.page_map.get(frame.page_num)
+        frame_tables = self._tables()
+        page_nums = self.page_nums
+        categories = self.categories
+        # Only the 2-byte cell count (page bytes 3-4) is needed: gather the
+        # high and low bytes for every frame with two strided slices
+        hi = lo = None
+        if self.page_size >= 5:
+            frame_total_size = WAL_FRAME_HEADER_SIZE + self.page_size
+            base = WAL_HEADER_SIZE + WAL_FRAME_HEADER_SIZE + 3
+            end = base + len(self.frames) * frame_total_size
+            hi = self._mv[base:end:frame_total_size].tobytes()
+            lo = self._mv[base + 1:end:frame_total_size].tobytes()
+
+        for fi in self._leaf_idx:
+            page_num = page_nums[fi]
+            table_name = frame_tables[fi]
             # Skip system tables, unmapped pages, schema pages
             if (not table_name or table_name in ("sqlite_master", "sqlite_sequence")
-                    or frame.page_num == 1):
+                    or page_num == 1):
                 continue
-            if table_name not in stats:
-                stats[table_name] = {
+            s = stats.get(table_name)
+            if s is None:
+                s = stats[table_name] = {
                     "total_records": 0,
                     "committed": 0,
                     "uncommitted": 0,
@@ -803,18 +1024,12 @@ class WALParser:
                     "pages": set(),
                     "is_wal_only": False,
                 }
-            s = stats[table_name]
             s["frames"] += 1
-            s["pages"].add(frame.page_num)
-
-            try:
-                page_data = self.get_page_data(frame.index)
-                if page_data and len(page_data) >= 5:
-                    cell_count = int.from_bytes(page_data[3:5], "big")
-                    s["total_records"] += cell_count
-                    s[frame.category] += cell_count
-            except Exception:
-                pass
+            s["pages"].add(page_num)
+            if hi is not None:
+                cell_count = (hi[fi] << 8) | lo[fi]
+                s["total_records"] += cell_count
+                s[categories[fi]] += cell_count
 
         return stats
 
@@ -826,77 +1041,56 @@ class WALParser:
 
         Returns list of dicts: {start_frame, end_frame, frame_count,
         pages, committed, salt1, salt2}
+
+        The result is cached until the frame list changes (reopen/close).
         """
         if not self._valid or not self.frames:
             return []
 
-        groups = []
-        current = {
-            "start_frame": 0,
-            "frames": [self.frames[0]],
-            "salt1": self.frames[0].salt1,
-            "salt2": self.frames[0].salt2,
-        }
-
-        for i in range(1, len(self.frames)):
-            f = self.frames[i]
-            # Same transaction if salt matches
-            if f.salt1 == current["salt1"] and f.salt2 == current["salt2"]:
-                current["frames"].append(f)
+        frames = self.frames
+        n = len(frames)
+        cache = self._groups_cache
+        if cache is not None and cache[0] is frames and cache[1] == n:
+            return list(cache[2])
+
+        page_nums = self.page_nums
+        commits = self.commit_sizes
+        salt1s = self.salt1s
+        salt2s = self.salt2s
+
+        # Group boundaries: a new group starts where the salt changes or
+        # right after a commit frame (frame 0's commit_size never closed
+        # a group, and still doesn't)
+        starts = [0]
+        starts.extend(i for i in range(1, n)
+                      if salt1s[i] != salt1s[i - 1] or salt2s[i] != salt2s[i - 1]
+                      or (i > 1 and commits[i - 1] > 0))
+        ends = starts[1:]
+        ends.append(n)
+
+        # One group per start, so the list is sized up front
+        groups = [None] * len(starts)
+        for gi, (a, b) in enumerate(zip(starts, ends)):
+            last = b - 1
+            if b < n:
+                # Closed by a commit frame or a salt change.  Only the first
+                # and last frames can carry a commit: any other commit frame
+                # would itself have ended the group
+                committed = commits[a] > 0 or commits[last] > 0
             else:
-                # Salt changed — finalize current group, start new one
-                grp = current["frames"]
-                groups.append({
-                    "start_frame": current["start_frame"],
-                    "end_frame": grp[-1].index,
-                    "frame_count": len(grp),
-                    "pages": sorted(set(fr.page_num for fr in grp)),
-                    "committed": any(fr.commit_size > 0 for fr in grp),
-                    "salt1": current["salt1"],
-                    "salt2": current["salt2"],
-                })
-                current = {
-                    "start_frame": f.index,
-                    "frames": [f],
-                    "salt1": f.salt1,
-                    "salt2": f.salt2,
-                }
-
-            # If this frame has commit_size > 0, it ends a transaction
-            if f.commit_size > 0:
-                grp = current["frames"]
-                groups.append({
-                    "start_frame": current["start_frame"],
-                    "end_frame": f.index,
-                    "frame_count": len(grp),
-                    "pages": sorted(set(fr.page_num for fr in grp)),
-                    "committed": True,
-                    "salt1": current["salt1"],
-                    "salt2": current["salt2"],
-                })
-                # Next frame (if any) starts a new group
-                if i + 1 < len(self.frames):
-                    nf = self.frames[i + 1]
-                    current = {
-                        "start_frame": nf.index,
-                        "frames": [],
-                        "salt1": nf.salt1,
-                        "salt2": nf.salt2,
-                    }
-                else:
-                    current = {"frames": []}
-
-        # Finalize any remaining frames (uncommitted tail)
-        if current.get("frames"):
-            grp = current["frames"]
-            groups.append({
-                "start_frame": current["start_frame"],
-                "end_frame": grp[-1].index,
-                "frame_count": len(grp),
-                "pages": sorted(set(fr.page_num for fr in grp)),
-                "committed": False,
-                "salt1": current.get("salt1", 0),
-                "salt2": current.get("salt2", 0),
-            })
-
-        return groups
+                # Uncommitted tail unless the final frame is a commit
+                committed = last > 0 and commits[last] > 0
+            # Single-frame groups (common for small transactions) need no dedup
+            pages = [page_nums[a]] if b - a == 1 else sorted(set(page_nums[a:b]))
+            groups[gi] = {
+                "start_frame": a,
+                "end_frame": last,
+                "frame_count": b - a,
+                "pages": pages,
+                "committed": committed,
+                "salt1": salt1s[a],
+                "salt2": salt2s[a],
+            }
+
+        self._groups_cache = (frames, n, groups)
+        return list(groups)
@@ -7,6 +7,14 @@ import tkinter.font as tkfont
 
 from constants import C
 
+_FONT_FAMILY = "Segoe UI" if sys.platform == "win32" else "Helvetica"
+_DEFAULT_FONT = (_FONT_FAMILY, 9)
+_BOLD_FONT = (_FONT_FAMILY, 9, "bold")
+_SMALL_FONT = (_FONT_FAMILY, 8)
+
+# Cap on cell-tooltip text; Tk's label layout and font.measure are O(chars)
+_MAX_TOOLTIP_CHARS = 2000
+
 
 # ── tooltip helper ────────────────────────────────────────────────────────
 class ToolTip:
@@ -15,7 +23,9 @@ class ToolTip:
         self.widget = widget
         self.text = text
         self.delay = delay
-        self._tip = None
+        self._tip = None      # Toplevel, created on first show and reused
+        self._lbl = None
+        self._visible = False
         self._after_id = None
         widget.bind("<Enter>", self._schedule, add="+")
         widget.bind("<Leave>", self._hide, add="+")
@@ -30,80 +40,135 @@ class ToolTip:
             return
         x = self.widget.winfo_rootx() + 20
         y = self.widget.winfo_rooty() + self.widget.winfo_height() + 4
-        self._tip = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(True)
+        tw = self._tip
+        if tw is None or not tw.winfo_exists():
+            self._tip = tw = tk.Toplevel(self.widget)
+            tw.withdraw()
+            tw.wm_overrideredirect(True)
+            tw.attributes("-topmost", True)
+            self._lbl = tk.Label(tw, text=self.text, bg="#333333", fg="#ffffff",
+                                 font=("Segoe UI", 8), padx=6, pady=3, relief="solid", bd=1,
+                                 wraplength=300, justify="left")
+            self._lbl.pack()
+        elif self._lbl.cget("text") != self.text:
+            self._lbl.configure(text=self.text)
         tw.wm_geometry(f"+{x}+{y}")
-        tw.attributes("-topmost", True)
-        lbl = tk.Label(tw, text=self.text, bg="#333333", fg="#ffffff",
-                       font=("Segoe UI", 8), padx=6, pady=3, relief="solid", bd=1,
-                       wraplength=300, justify="left")
-        lbl.pack()
+        tw.deiconify()
+        self._visible = True
 
     def _hide(self, event=None):
         if self._after_id:
             self.widget.after_cancel(self._after_id)
             self._after_id = None
-        if self._tip:
-            self._tip.destroy()
-            self._tip = None
+        if self._visible:
+            self._visible = False
+            try:
+                self._tip.withdraw()
+            except tk.TclError:
+                self._tip = None
 
 
 # ── treeview cell tooltip ────────────────────────────────────────────────
 class TreeviewTooltip:
     """Hover tooltip for Treeview cells — shows full cell text when truncated."""
+
     def __init__(self, tree, delay=400):
         self.tree = tree
         self.delay = delay
-        self._tip = None
+        self._tip = None      # Toplevel, created on first show and reused
+        self._lbl = None
+        self._wrap = None     # wraplength currently set on _lbl
+        self._visible = False
         self._after_id = None
         self._last_cell = (None, None)
-        self._font = None
+        self._motion_id = None     # pending after_idle that handles motion
+        self._motion_event = None  # latest <Motion> event, read when it fires
+        self._measure = None   # bound TkDefaultFont.measure, set on first show
+        self._col_widths = {}  # display column id ("#N") → width
         tree.bind("<Motion>", self._on_motion, add="+")
+        tree.bind("<Configure>", self._invalidate_widths, add="+")
         tree.bind("<Leave>", self._hide, add="+")
         tree.bind("<ButtonPress>", self._hide, add="+")
         tree.bind("<MouseWheel>", self._hide, add="+")
 
     def _on_motion(self, event):
-        row = self.tree.identify_row(event.y)
-        col = self.tree.identify_column(event.x)
+        # <Motion> fires constantly; coalesce a burst of events into one
+        # identify_* pass over the latest pointer position
+        self._motion_event = event
+        if self._motion_id is None:
+            self._motion_id = self.tree.after_idle(self._process_motion)
+
+    def _process_motion(self):
+        self._motion_id = None
+        event = self._motion_event
+        x, y = event.x, event.y
+        row = self.tree.identify_row(y)
+        if not row:
+            # Heading or empty area below the rows: nothing to show, and
+            # nothing to hide unless we just left a cell
+            if self._last_cell != (None, None):
+                self._last_cell = (None, None)
+                if self._visible or self._after_id:
+                    self._hide()
+            return
+        col = self.tree.identify_column(x)
         cell = (row, col)
         if cell == self._last_cell:
             return
+        if self._visible or self._after_id:
+            self._hide()
         self._last_cell = cell
-        self._hide()
-        if row and col:
+        if col:
             self._after_id = self.tree.after(self.delay, lambda: self._show(row, col, event))
 
     def _show(self, row, col, event):
         if not self.tree.winfo_exists():
             return
-        try:
-            col_idx = int(col.replace("#", "")) - 1
-            values = self.tree.item(row, "values")
-            if col_idx < 0 or col_idx >= len(values):
-                return
-            text = str(values[col_idx])
-            if not text or len(text) < 10:
-                return
-            # Measure actual text width using font
-            if not self._font:
-                self._font = tkfont.nametofont("TkDefaultFont")
-            col_id = self.tree.cget("columns")[col_idx] if self.tree.cget("columns") else col
-            col_width = self.tree.column(col_id, "width")
-            text_px = self._font.measure(text)
-            if text_px <= col_width - 20:
-                return  # fits — no tooltip needed
-        except Exception:
+        # Row may have been removed (tree repopulated) during the delay
+        if not col[1:].isdigit() or not self.tree.exists(row):
+            return
+        col_idx = int(col[1:]) - 1
+        values = self.tree.item(row, "values")
+        if col_idx < 0 or col_idx >= len(values):
             return
+        text = str(values[col_idx])
+        if len(text) < 10:
+            return
+        if len(text) > _MAX_TOOLTIP_CHARS:
+            text = text[:_MAX_TOOLTIP_CHARS] + "… (truncated)"
+        # Measure actual text width using font
+        if self._measure is None:
+            self._measure = tkfont.nametofont("TkDefaultFont").measure
+        col_width = self._col_widths.get(col)
+        if col_width is None:
+            try:
+                col_width = self.tree.column(col, "width")
+            except tk.TclError:
+                return  # column set changed under the pointer
+            self._col_widths[col] = col_width
+        text_px = self._measure(text)
+        if text_px <= col_width - 20:
+            return  # fits — no tooltip needed
+        # Short text goes on one line; only long text needs Tk's wrap layout
+        wrap = 0 if text_px < 480 else 500
         x = self.tree.winfo_rootx() + event.x + 15
         y = self.tree.winfo_rooty() + event.y + 20
-        self._tip = tw = tk.Toplevel(self.tree)
-        tw.wm_overrideredirect(True)
-        tw.attributes("-topmost", True)
-        lbl = tk.Label(tw, text=text, bg="#2d2d2d", fg="#f0f0f0",
-                       font=("Consolas", 9), padx=8, pady=5, relief="solid", bd=1,
-                       wraplength=500, justify="left")
-        lbl.pack()
+        tw = self._tip
+        if tw is None or not tw.winfo_exists():
+            self._tip = tw = tk.Toplevel(self.tree)
+            tw.withdraw()
+            tw.wm_overrideredirect(True)
+            tw.attributes("-topmost", True)
+            self._lbl = tk.Label(tw, text=text, bg="#2d2d2d", fg="#f0f0f0",
+                                 font=("Consolas", 9), padx=8, pady=5, relief="solid", bd=1,
+                                 wraplength=wrap, justify="left")
+            self._lbl.pack()
+            self._wrap = wrap
+        elif wrap != self._wrap:
+            self._lbl.configure(text=text, wraplength=wrap)
+            self._wrap = wrap
+        else:
+            self._lbl.configure(text=text)
         # Keep tooltip within screen bounds
         tw.update_idletasks()
         sw = tw.winfo_screenwidth()
@@ -115,64 +180,87 @@ class TreeviewTooltip:
         if y + tw_h > sh - 10:
             y = event.y_root - tw_h - 5
         tw.wm_geometry(f"+{x}+{y}")
+        tw.deiconify()
+        self._visible = True
+
+    def _invalidate_widths(self, event=None):
+        self._col_widths = {}
 
     def _hide(self, event=None):
         if self._after_id:
             self.tree.after_cancel(self._after_id)
             self._after_id = None
-        if self._tip:
-            self._tip.destroy()
-            self._tip = None
+        if self._visible:
+            self._visible = False
+            try:
+                self._tip.withdraw()
+            except tk.TclError:
+                self._tip = None
         self._last_cell = (None, None)
+        # Leaving the tree or clicking (column drag, table switch) may change
+        # column layout — drop cached widths and any unhandled motion
+        if event is not None:
+            self._col_widths = {}
+            if self._motion_id is not None:
+                self.tree.after_cancel(self._motion_id)
+                self._motion_id = None
 
 
 # ── Theme setup ──────────────────────────────────────────────────────────
 def setup_theme(root):
     style = ttk.Style(root)
     style.theme_use("clam")
-    font_family = "Segoe UI" if sys.platform == "win32" else "Helvetica"
-    default_font = (font_family, 9)
-    bold_font = (font_family, 9, "bold")
-    small_font = (font_family, 8)
-
-    style.configure("TFrame", background=C["bg"])
-    style.configure("TLabel", background=C["bg"], foreground=C["text"], font=default_font)
-    style.configure("M.TLabel", background=C["bg"], foreground=C["text2"], font=small_font)
-    style.configure("B.TLabel", background=C["bg"], foreground=C["text"], font=bold_font)
-    style.configure("H.TFrame", background=C["hbg"])
-    style.configure("H.TLabel", background=C["hbg"], foreground=C["hfg"], font=(font_family, 14, "bold"))
-    style.configure("HI.TLabel", background=C["hbg"], foreground=C["hfg"], font=default_font)
-    style.configure("S.TFrame", background=C["sbg"])
-    style.configure("S.TLabel", background=C["sbg"], foreground=C["text"], font=default_font)
-
-    style.configure("TButton", font=default_font, padding=(8, 3))
-    style.configure("P.TButton", background=C["accent"], foreground="#ffffff", font=bold_font, padding=(10, 4))
-    style.map("P.TButton", background=[("active", "#003d99")])
-    style.configure("D.TButton", background=C["red"], foreground="#ffffff", font=bold_font, padding=(10, 4))
-    style.map("D.TButton", background=[("active", "#b52a00")])
-    style.configure("G.TButton", background=C["green"], foreground="#ffffff", font=bold_font, padding=(10, 4))
-    style.map("G.TButton", background=[("active", "#006644")])
-    style.configure("Sm.TButton", font=small_font, padding=(4, 1))
-    style.configure("HB.TButton", background="#0052cc", foreground="#ffffff", font=default_font, padding=(8, 3))
-    style.map("HB.TButton", background=[("active", "#003d99")])
-
-    style.configure("Treeview", background=C["bg"], fieldbackground=C["bg"],
-                     foreground=C["text"], rowheight=24, font=default_font,
-                     borderwidth=0)
-    style.map("Treeview", background=[("selected", C["tsel"])],
-              foreground=[("selected", C["text"])])
-    style.configure("Treeview.Heading", background=C["bg3"], foreground=C["text"],
-                     font=bold_font, relief="flat")
-
-    style.configure("Sc.Treeview", background=C["sbg"], fieldbackground=C["sbg"],
-                     foreground=C["text"], rowheight=24, font=default_font)
-    style.configure("Sc.Treeview.Heading", background=C["bg3"], foreground=C["text"],
-                     font=bold_font, relief="flat")
-    style.map("Sc.Treeview", background=[("selected", C["tsel"])])
-    style.configure("Treeview.Heading", relief="solid", borderwidth=1)
-
-    style.configure("TCombobox", font=default_font)
-    style.configure("TEntry", font=default_font)
-    style.configure("SE.TEntry", font=(font_family, 11))
-    style.configure("TProgressbar", troughcolor=C["bg3"], background=C["accent"])
-    style.configure("TCheckbutton", background=C["bg"], font=default_font)
+    bg, sbg, hbg, bg3 = C["bg"], C["sbg"], C["hbg"], C["bg3"]
+    text, accent = C["text"], C["accent"]
+    white = "#ffffff"
+
+    configure = (
+        ("TFrame", dict(background=bg)),
+        ("TLabel", dict(background=bg, foreground=text, font=_DEFAULT_FONT)),
+        ("M.TLabel", dict(background=bg, foreground=C["text2"], font=_SMALL_FONT)),
+        ("B.TLabel", dict(background=bg, foreground=text, font=_BOLD_FONT)),
+        ("H.TFrame", dict(background=hbg)),
+        ("H.TLabel", dict(background=hbg, foreground=C["hfg"], font=(_FONT_FAMILY, 14, "bold"))),
+        ("HI.TLabel", dict(background=hbg, foreground=C["hfg"], font=_DEFAULT_FONT)),
+        ("S.TFrame", dict(background=sbg)),
+        ("S.TLabel", dict(background=sbg, foreground=text, font=_DEFAULT_FONT)),
+
+        ("TButton", dict(font=_DEFAULT_FONT, padding=(8, 3))),
+        ("P.TButton", dict(background=accent, foreground=white, font=_BOLD_FONT, padding=(10, 4))),
+        ("D.TButton", dict(background=C["red"], foreground=white, font=_BOLD_FONT, padding=(10, 4))),
+        ("G.TButton", dict(background=C["green"], foreground=white, font=_BOLD_FONT, padding=(10, 4))),
+        ("Sm.TButton", dict(font=_SMALL_FONT, padding=(4, 1))),
+        ("HB.TButton", dict(background="#0052cc", foreground=white, font=_DEFAULT_FONT, padding=(8, 3))),
+        ("RowCopy.TButton", dict(background=C["bg2"], foreground=accent,
+                                 font=(_FONT_FAMILY, 7, "bold"), relief="flat", borderwidth=0,
+                                 padding=(4, 1))),
+
+        ("Treeview", dict(background=bg, fieldbackground=bg, foreground=text, rowheight=24,
+                          font=_DEFAULT_FONT, borderwidth=0)),
+        ("Treeview.Heading", dict(background=bg3, foreground=text, font=_BOLD_FONT,
+                                  relief="solid", borderwidth=1)),
+        ("Sc.Treeview", dict(background=sbg, fieldbackground=sbg, foreground=text, rowheight=24,
+                             font=_DEFAULT_FONT)),
+        ("Sc.Treeview.Heading", dict(background=bg3, foreground=text, font=_BOLD_FONT,
+                                     relief="flat")),
+
+        ("TCombobox", dict(font=_DEFAULT_FONT)),
+        ("TEntry", dict(font=_DEFAULT_FONT)),
+        ("SE.TEntry", dict(font=(_FONT_FAMILY, 11))),
+        ("TProgressbar", dict(troughcolor=bg3, background=accent)),
+        ("TCheckbutton", dict(background=bg, font=_DEFAULT_FONT)),
+    )
+    maps = (
+        ("P.TButton", dict(background=[("active", "#003d99")])),
+        ("D.TButton", dict(background=[("active", "#b52a00")])),
+        ("G.TButton", dict(background=[("active", "#006644")])),
+        ("HB.TButton", dict(background=[("active", "#003d99")])),
+        ("RowCopy.TButton", dict(background=[("active", C["acl"])])),
+        ("Treeview", dict(background=[("selected", C["tsel"])],
+                          foreground=[("selected", text)])),
+        ("Sc.Treeview", dict(background=[("selected", C["tsel"])])),
+    )
+    for name, kw in configure:
+        style.configure(name, **kw)
+    for name, kw in maps:
+        style.map(name, **kw)